@@ -27,6 +27,13 @@ with open(os.path.join(os.path.dirname(__file__),
 
 
 class EnforcedNullType:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __eq__(self, other):
         return isinstance(other, self.__class__)
     
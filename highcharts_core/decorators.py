@@ -258,6 +258,9 @@ def class_sensitive(types = None,
                 raise errors.HighchartsError('Something went wrong. Unsure how this '
                                              'might happen.')
 
+            if value is None and allow_none and not force_iterable:
+                return func(args[0], None)
+
             value = validate_types(value,
                                    types = types,
                                    allow_dict = allow_dict,
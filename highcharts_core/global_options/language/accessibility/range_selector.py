@@ -1,4 +1,5 @@
 from __future__ import annotations
+import sys
 from typing import Optional
 
 from validator_collection import validators
@@ -6,20 +7,30 @@ from validator_collection import validators
 from highcharts_core import constants
 from highcharts_core.metaclasses import HighchartsMeta
 
+_vstring = validators.string
+
 
 class RangeSelectorLanguageOptions(HighchartsMeta):
     """Language options for range selectors when used in accessibility mode."""
 
-    def __init__(self, **kwargs):
-        self._click_button_announcement = None
-        self._dropdown_label = None
-        self._max_input_label = None
-        self._min_input_label = None
+    __slots__ = ('_click_button_announcement', '_dropdown_label',
+                 '_max_input_label', '_min_input_label')
 
-        self.click_button_announcement = kwargs.get('click_button_announcement', None)
-        self.dropdown_label = kwargs.get('dropdown_label', None)
-        self.max_input_label = kwargs.get('max_input_label', None)
-        self.min_input_label = kwargs.get('min_input_label', None)
+    _FIELDS = (
+        ('click_button_announcement', '_click_button_announcement',
+         sys.intern('clickButtonAnnouncement')),
+        ('dropdown_label', '_dropdown_label', sys.intern('dropdownLabel')),
+        ('max_input_label', '_max_input_label', sys.intern('maxInputLabel')),
+        ('min_input_label', '_min_input_label', sys.intern('minInputLabel')),
+    )
+
+    def __init__(self, **kwargs):
+        for field in self._FIELDS:
+            value = kwargs.get(field[0], None)
+            if value is None:
+                setattr(self, field[1], None)
+            else:
+                setattr(self, field[0], value)
 
     @property
     def click_button_announcement(self) -> Optional[str]:
@@ -32,7 +43,7 @@ class RangeSelectorLanguageOptions(HighchartsMeta):
 
     @click_button_announcement.setter
     def click_button_announcement(self, value):
-        self._click_button_announcement = validators.string(value, allow_empty = True)
+        self._click_button_announcement = _vstring(value, allow_empty = True)
 
     @property
     def dropdown_label(self) -> Optional[str]:
@@ -45,7 +56,7 @@ class RangeSelectorLanguageOptions(HighchartsMeta):
 
     @dropdown_label.setter
     def dropdown_label(self, value):
-        self._dropdown_label = validators.string(value, allow_empty = True)
+        self._dropdown_label = _vstring(value, allow_empty = True)
 
     @property
     def max_input_label(self) -> Optional[str]:
@@ -58,7 +69,7 @@ class RangeSelectorLanguageOptions(HighchartsMeta):
 
     @max_input_label.setter
     def max_input_label(self, value):
-        self._max_input_label = validators.string(value, allow_empty = True)
+        self._max_input_label = _vstring(value, allow_empty = True)
 
     @property
     def min_input_label(self) -> Optional[str]:
@@ -71,25 +82,11 @@ class RangeSelectorLanguageOptions(HighchartsMeta):
 
     @min_input_label.setter
     def min_input_label(self, value):
-        self._min_input_label = validators.string(value, allow_empty = True)
+        self._min_input_label = _vstring(value, allow_empty = True)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'click_button_announcement': as_dict.get('clickButtonAnnouncement', None),
-            'dropdown_label': as_dict.get('dropdownLabel', None),
-            'max_input_label': as_dict.get('maxInputLabel', None),
-            'min_input_label': as_dict.get('minInputLabel', None),
-        }
-
-        return kwargs
+        return cls._get_kwargs_from_field_map(as_dict)
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'clickButtonAnnouncement': self.click_button_announcement,
-            'dropdownLabel': self.dropdown_label,
-            'maxInputLabel': self.max_input_label,
-            'minInputLabel': self.min_input_label
-        }
-
-        return untrimmed
+        return self._to_untrimmed_dict_from_field_map()
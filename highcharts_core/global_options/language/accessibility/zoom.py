@@ -1,4 +1,5 @@
 from __future__ import annotations
+import sys
 from typing import Optional
 
 from validator_collection import validators
@@ -6,18 +7,27 @@ from validator_collection import validators
 from highcharts_core import constants
 from highcharts_core.metaclasses import HighchartsMeta
 
+_vstring = validators.string
+
 
 class ZoomLanguageOptions(HighchartsMeta):
     """Chart and map zoom accessibility language options."""
 
-    def __init__(self, **kwargs):
-        self._map_zoom_in = None
-        self._map_zoom_out = None
-        self._reset_zoom_button = None
+    __slots__ = ('_map_zoom_in', '_map_zoom_out', '_reset_zoom_button')
+
+    _FIELDS = (
+        ('map_zoom_in', '_map_zoom_in', sys.intern('mapZoomIn')),
+        ('map_zoom_out', '_map_zoom_out', sys.intern('mapZoomOut')),
+        ('reset_zoom_button', '_reset_zoom_button', sys.intern('resetZoomButton')),
+    )
 
-        self.map_zoom_in = kwargs.get('map_zoom_in', None)
-        self.map_zoom_out = kwargs.get('map_zoom_out', None)
-        self.reset_zoom_button = kwargs.get('reset_zoom_button', None)
+    def __init__(self, **kwargs):
+        for field in self._FIELDS:
+            value = kwargs.get(field[0], None)
+            if value is None:
+                setattr(self, field[1], None)
+            else:
+                setattr(self, field[0], value)
 
     @property
     def map_zoom_in(self) -> Optional[str]:
@@ -30,7 +40,7 @@ class ZoomLanguageOptions(HighchartsMeta):
 
     @map_zoom_in.setter
     def map_zoom_in(self, value):
-        self._map_zoom_in = validators.string(value, allow_empty = True)
+        self._map_zoom_in = _vstring(value, allow_empty = True)
 
     @property
     def map_zoom_out(self) -> Optional[str]:
@@ -43,7 +53,7 @@ class ZoomLanguageOptions(HighchartsMeta):
 
     @map_zoom_out.setter
     def map_zoom_out(self, value):
-        self._map_zoom_out = validators.string(value, allow_empty = True)
+        self._map_zoom_out = _vstring(value, allow_empty = True)
 
     @property
     def reset_zoom_button(self) -> Optional[str]:
@@ -56,23 +66,11 @@ class ZoomLanguageOptions(HighchartsMeta):
 
     @reset_zoom_button.setter
     def reset_zoom_button(self, value):
-        self._reset_zoom_button = validators.string(value, allow_empty = True)
+        self._reset_zoom_button = _vstring(value, allow_empty = True)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'map_zoom_in': as_dict.get('mapZoomIn', None),
-            'map_zoom_out': as_dict.get('mapZoomOut', None),
-            'reset_zoom_button': as_dict.get('resetZoomButton', None),
-        }
-
-        return kwargs
+        return cls._get_kwargs_from_field_map(as_dict)
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'mapZoomIn': self.map_zoom_in,
-            'mapZoomOut': self.map_zoom_out,
-            'resetZoomButton': self.reset_zoom_button
-        }
-
-        return untrimmed
+        return self._to_untrimmed_dict_from_field_map()
@@ -89,8 +89,14 @@ class HighchartsMeta(ABC):
         if not scripts:
             scripts = []
         
+        attribute_names = list(self.__dict__)
+        for klass in type(self).__mro__:
+            for name in getattr(klass, '__slots__', ()):
+                if name not in attribute_names:
+                    attribute_names.append(name)
+
         properties = {}
-        for key in self.__dict__:
+        for key in attribute_names:
             if key[0] != '_':
                 continue
 
@@ -194,6 +200,44 @@ class HighchartsMeta(ABC):
         """
         raise NotImplementedError()
 
+    def _to_untrimmed_dict_from_field_map(self) -> dict:
+        """Generate the first-level :class:`dict <python:dict>` representation of the
+        object from the class-level ``_FIELDS`` table.
+
+        .. note::
+
+          Classes that declare a ``_FIELDS`` table - a tuple of
+          ``(kwarg name, private attribute, JS key)`` entries - can implement
+          :meth:`_to_untrimmed_dict() <HighchartsMeta._to_untrimmed_dict>` by
+          delegating to this method, keeping the property-to-JS-key mapping in one
+          place.
+
+          Keys whose value is :obj:`None <python:None>` are omitted up front, since
+          :meth:`trim_dict() <HighchartsMeta.trim_dict>` would drop them anyway.
+
+        :rtype: :class:`dict <python:dict>`
+        """
+        return {field[2]: value
+                for field in self._FIELDS
+                if (value := getattr(self, field[0])) is not None}
+
+    @classmethod
+    def _get_kwargs_from_field_map(cls, as_dict) -> dict:
+        """Return the keyword arguments used to initialize the class from a Highcharts
+        JavaScript-compatible :class:`dict <python:dict>`, as determined by the
+        class-level ``_FIELDS`` table.
+
+        :param as_dict: The HighCharts JS compatible :class:`dict <python:dict>`
+          representation of the object.
+        :type as_dict: :class:`dict <python:dict>`
+
+        :returns: The keyword arguments that would be used to initialize an instance.
+        :rtype: :class:`dict <python:dict>`
+
+        """
+        return {field[0]: as_dict.get(field[2], None)
+                for field in cls._FIELDS}
+
     @staticmethod
     def trim_iterable(untrimmed,
                       to_json = False,
@@ -278,9 +322,7 @@ class HighchartsMeta(ABC):
         :rtype: :class:`dict <python:dict>`
         """
         as_dict = {}
-        for key in untrimmed:
-            context_key = f'{context}.{key}'
-            value = untrimmed.get(key, None)
+        for key, value in untrimmed.items():
             # bool -> Boolean
             if isinstance(value, bool):
                 as_dict[key] = value
@@ -358,7 +400,7 @@ class HighchartsMeta(ABC):
             elif value in [0, 0., False]:
                 as_dict[key] = value
             # other falsy -> str, but empty string is allowed
-            elif value == '' and context_key in constants.EMPTY_STRING_CONTEXTS:
+            elif value == '' and f'{context}.{key}' in constants.EMPTY_STRING_CONTEXTS:
                 as_dict[key] = ''
 
         return as_dict
@@ -976,9 +1018,7 @@ class JavaScriptDict(UserDict):
         :rtype: :class:`dict <python:dict>`
         """
         as_dict = {}
-        for key in untrimmed:
-            context_key = f'{context}.{key}'
-            value = untrimmed.get(key, None)
+        for key, value in untrimmed.items():
             # bool -> Boolean
             if isinstance(value, bool):
                 as_dict[key] = value
@@ -1042,7 +1082,7 @@ class JavaScriptDict(UserDict):
             elif value in [0, 0., False]:
                 as_dict[key] = value
             # other falsy -> str, but empty string is allowed
-            elif value == '' and context_key in constants.EMPTY_STRING_CONTEXTS:
+            elif value == '' and f'{context}.{key}' in constants.EMPTY_STRING_CONTEXTS:
                 as_dict[key] = ''
 
         return as_dict
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import sys
 from typing import Optional
 
 from validator_collection import validators
@@ -6,21 +7,33 @@ from validator_collection import validators
 from highcharts_core import errors
 from highcharts_core.metaclasses import HighchartsMeta
 
+_vstring = validators.string
+_vinteger = validators.integer
+
+_MODE_VALUES = frozenset(('normal', 'serialize'))
+
 
 class SeriesNavigation(HighchartsMeta):
     """Options for the keyboard navigation of data points and series."""
 
-    def __init__(self, **kwargs):
-        self._mode = None
-        self._point_navigation_enabled_threshold = None
-        self._remember_point_focus = None
-        self._skip_null_points = None
+    __slots__ = ('_mode', '_point_navigation_enabled_threshold',
+                 '_remember_point_focus', '_skip_null_points')
 
-        self.mode = kwargs.get('mode', None)
-        self.point_navigation_enabled_threshold = kwargs.get('point_navigation_enabled_threshold',
-                                                             None)
-        self.remember_point_focus = kwargs.get('remember_point_focus', None)
-        self.skip_null_points = kwargs.get('skip_null_points', None)
+    _FIELDS = (
+        ('mode', '_mode', sys.intern('mode')),
+        ('point_navigation_enabled_threshold', '_point_navigation_enabled_threshold',
+         sys.intern('pointNavigationEnabledThreshold')),
+        ('remember_point_focus', '_remember_point_focus', sys.intern('rememberPointFocus')),
+        ('skip_null_points', '_skip_null_points', sys.intern('skipNullPoints')),
+    )
+
+    def __init__(self, **kwargs):
+        for field in self._FIELDS:
+            value = kwargs.get(field[0], None)
+            if value is None:
+                setattr(self, field[1], None)
+            else:
+                setattr(self, field[0], value)
 
     @property
     def mode(self) -> Optional[str]:
@@ -47,8 +60,10 @@ class SeriesNavigation(HighchartsMeta):
         if not value:
             self._mode = None
         else:
-            value = validators.string(value).lower()
-            if value not in ['normal', 'serialize']:
+            if not isinstance(value, str):
+                value = _vstring(value)
+            value = value.lower()
+            if value not in _MODE_VALUES:
                 raise errors.HighchartsValueError(f'Expects either "normal" or '
                                                   f'"serialize". Received: {value}')
 
@@ -73,10 +88,12 @@ class SeriesNavigation(HighchartsMeta):
             self._point_navigation_enabled_threshold = None
         elif isinstance(value, bool) and value is False:
             self._point_navigation_enabled_threshold = False
+        elif value.__class__ is int:
+            self._point_navigation_enabled_threshold = value
         else:
-            value = validators.integer(value,
-                                       allow_empty = False,
-                                       coerce_value = True)
+            value = _vinteger(value,
+                              allow_empty = False,
+                              coerce_value = True)
             self._point_navigation_enabled_threshold = value
 
     @property
@@ -96,6 +113,8 @@ class SeriesNavigation(HighchartsMeta):
     def remember_point_focus(self, value):
         if value is None:
             self._remember_point_focus = None
+        elif value.__class__ is bool:
+            self._remember_point_focus = value
         else:
             self._remember_point_focus = bool(value)
 
@@ -113,25 +132,14 @@ class SeriesNavigation(HighchartsMeta):
     def skip_null_points(self, value):
         if value is None:
             self._skip_null_points = None
+        elif value.__class__ is bool:
+            self._skip_null_points = value
         else:
             self._skip_null_points = bool(value)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'mode': as_dict.get('mode', None),
-            'point_navigation_enabled_threshold': as_dict.get('pointNavigationEnabledThreshold',
-                                                              None),
-            'remember_point_focus': as_dict.get('rememberPointFocus', None),
-            'skip_null_points': as_dict.get('skipNullPoints', None),
-        }
-        return kwargs
+        return cls._get_kwargs_from_field_map(as_dict)
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'mode': self.mode,
-            'pointNavigationEnabledThreshold': self.point_navigation_enabled_threshold,
-            'rememberPointFocus': self.remember_point_focus,
-            'skipNullPoints': self.skip_null_points
-        }
-        return untrimmed
+        return self._to_untrimmed_dict_from_field_map()
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import sys
 from typing import Optional
 
 from validator_collection import validators
@@ -8,19 +9,36 @@ from highcharts_core.decorators import class_sensitive
 from highcharts_core.metaclasses import HighchartsMeta
 from highcharts_core.utility_classes.position import Position
 
+_vstring = validators.string
+_vdict = validators.dict
+
+_RELATIVE_TO_VALUES = {
+    'plot': 'plot',
+    'chart': 'chart',
+    'plotbox': 'plotBox',
+    'spacingbox': 'spacingBox',
+}
+
 
 class ResetZoomButtonOptions(HighchartsMeta):
     """Configuration settings for the button that appears after a selection zoom,
     allowing the user to reset zoom."""
 
-    def __init__(self, **kwargs):
-        self._position = None
-        self._relative_to = None
-        self._theme = None
+    __slots__ = ('_position', '_relative_to', '_theme')
 
-        self.position = kwargs.get('position', None)
-        self.relative_to = kwargs.get('relative_to', None)
-        self.theme = kwargs.get('theme', None)
+    _FIELDS = (
+        ('position', '_position', sys.intern('position')),
+        ('relative_to', '_relative_to', sys.intern('relativeTo')),
+        ('theme', '_theme', sys.intern('theme')),
+    )
+
+    def __init__(self, **kwargs):
+        for field in self._FIELDS:
+            value = kwargs.get(field[0], None)
+            if value is None:
+                setattr(self, field[1], None)
+            else:
+                setattr(self, field[0], value)
 
     @property
     def position(self) -> Optional[Position]:
@@ -55,13 +73,14 @@ class ResetZoomButtonOptions(HighchartsMeta):
         if not value:
             self._relative_to = None
         else:
-            value = validators.string(value)
-            value = value.lower()
-            if value not in ['plot', 'chart', 'plotBox', 'spacingBox']:
+            if not isinstance(value, str):
+                value = _vstring(value)
+            try:
+                self._relative_to = _RELATIVE_TO_VALUES[value.lower()]
+            except KeyError:
                 raise errors.HighchartsValueError(f'relative_to accepts "plot", "chart", '
                                                   f'"plotBox", "spacingBox", or None. '
                                                   f'Received: {value}')
-            self._relative_to = value
 
     @property
     def theme(self) -> Optional[dict]:
@@ -83,23 +102,11 @@ class ResetZoomButtonOptions(HighchartsMeta):
         if not value or isinstance(value, constants.EnforcedNullType):
             self._theme = None
         else:
-            self._theme = validators.dict(value, allow_empty = False)
+            self._theme = _vdict(value, allow_empty = False)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'position': as_dict.get('position', None),
-            'relative_to': as_dict.get('relativeTo', None),
-            'theme': as_dict.get('theme', None),
-        }
-
-        return kwargs
+        return cls._get_kwargs_from_field_map(as_dict)
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'position': self.position,
-            'relativeTo': self.relative_to,
-            'theme': self.theme
-        }
-
-        return untrimmed
+        return self._to_untrimmed_dict_from_field_map()
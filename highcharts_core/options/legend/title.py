@@ -1,21 +1,32 @@
 from __future__ import annotations
+import sys
 from typing import Optional
 
 from validator_collection import validators
 
-from highcharts_core import constants
 from highcharts_core.metaclasses import HighchartsMeta
 
+_vdict = validators.dict
+_vstring = validators.string
+
 
 class LegendTitle(HighchartsMeta):
     """A title to be added on top of the legend."""
 
-    def __init__(self, **kwargs):
-        self._style = None
-        self._text = None
+    __slots__ = ('_style', '_text')
+
+    _FIELDS = (
+        ('style', '_style', sys.intern('style')),
+        ('text', '_text', sys.intern('text')),
+    )
 
-        self.style = kwargs.get('style', None)
-        self.text = kwargs.get('text', None)
+    def __init__(self, **kwargs):
+        for field in self._FIELDS:
+            value = kwargs.get(field[0], None)
+            if value is None:
+                setattr(self, field[1], None)
+            else:
+                setattr(self, field[0], value)
 
     @property
     def style(self) -> Optional[str | dict]:
@@ -29,12 +40,20 @@ class LegendTitle(HighchartsMeta):
 
     @style.setter
     def style(self, value):
-        try:
-            self._style = validators.dict(value, allow_empty = True)
-        except (ValueError, TypeError):
-            self._style = validators.string(value, 
-                                            allow_empty = True,
-                                            coerce_value = True)
+        if value is None:
+            self._style = None
+        elif isinstance(value, dict):
+            self._style = value
+        elif isinstance(value, str) and '{' not in value:
+            # plain CSS strings can never deserialize to a dict, so skip the attempt
+            self._style = value
+        else:
+            try:
+                self._style = _vdict(value, allow_empty = True)
+            except (ValueError, TypeError):
+                self._style = _vstring(value,
+                                       allow_empty = True,
+                                       coerce_value = True)
 
     @property
     def text(self) -> Optional[str]:
@@ -46,21 +65,14 @@ class LegendTitle(HighchartsMeta):
 
     @text.setter
     def text(self, value):
-        self._text = validators.string(value, allow_empty = True)
+        if value is None:
+            self._text = None
+        else:
+            self._text = _vstring(value, allow_empty = True)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'style': as_dict.get('style', None),
-            'text': as_dict.get('text', None)
-        }
-
-        return kwargs
+        return cls._get_kwargs_from_field_map(as_dict)
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'style': self.style,
-            'text': self.text
-        }
-
-        return untrimmed
+        return self._to_untrimmed_dict_from_field_map()
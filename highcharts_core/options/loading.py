@@ -1,4 +1,5 @@
 from __future__ import annotations
+import sys
 from typing import Optional
 
 from validator_collection import validators
@@ -6,6 +7,10 @@ from validator_collection import validators
 from highcharts_core import constants
 from highcharts_core.metaclasses import HighchartsMeta
 
+_vstring = validators.string
+_vinteger = validators.integer
+_vdict = validators.dict
+
 
 class Loading(HighchartsMeta):
     """The loading options control the appearance of the loading screen that covers
@@ -23,16 +28,22 @@ class Loading(HighchartsMeta):
 
     """
 
-    def __init__(self, **kwargs):
-        self._hide_duration = None
-        self._label_style = None
-        self._show_duration = None
-        self._style = None
+    __slots__ = ('_hide_duration', '_label_style', '_show_duration', '_style')
 
-        self.hide_duration = kwargs.get('hide_duration', None)
-        self.label_style = kwargs.get('label_style', None)
-        self.show_duration = kwargs.get('show_duration', None)
-        self.style = kwargs.get('style', None)
+    _FIELDS = (
+        ('hide_duration', '_hide_duration', sys.intern('hideDuration')),
+        ('label_style', '_label_style', sys.intern('labelStyle')),
+        ('show_duration', '_show_duration', sys.intern('showDuration')),
+        ('style', '_style', sys.intern('style')),
+    )
+
+    def __init__(self, **kwargs):
+        for field in self._FIELDS:
+            value = kwargs.get(field[0], None)
+            if value is None:
+                setattr(self, field[1], None)
+            else:
+                setattr(self, field[0], value)
 
     @property
     def _dot_path(self) -> Optional[str]:
@@ -53,7 +64,7 @@ class Loading(HighchartsMeta):
 
     @hide_duration.setter
     def hide_duration(self, value):
-        self._hide_duration = validators.integer(value,
+        self._hide_duration = _vinteger(value,
                                                  allow_empty = True,
                                                  minimum = 0)
 
@@ -69,11 +80,11 @@ class Loading(HighchartsMeta):
     @label_style.setter
     def label_style(self, value):
         try:
-            self._style = validators.dict(value, allow_empty = True)
+            self._label_style = _vdict(value, allow_empty = True)
         except (ValueError, TypeError):
-            self._style = validators.string(value, 
-                                            allow_empty = True,
-                                            coerce_value = True)
+            self._label_style = _vstring(value,
+                                                  allow_empty = True,
+                                                  coerce_value = True)
 
     @property
     def show_duration(self) -> Optional[int]:
@@ -86,7 +97,7 @@ class Loading(HighchartsMeta):
 
     @show_duration.setter
     def show_duration(self, value):
-        self._show_duration = validators.integer(value,
+        self._show_duration = _vinteger(value,
                                                  allow_empty = True,
                                                  minimum = 0)
 
@@ -102,29 +113,15 @@ class Loading(HighchartsMeta):
     @style.setter
     def style(self, value):
         try:
-            self._style = validators.dict(value, allow_empty = True)
+            self._style = _vdict(value, allow_empty = True)
         except (ValueError, TypeError):
-            self._style = validators.string(value, 
+            self._style = _vstring(value, 
                                             allow_empty = True,
                                             coerce_value = True)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'hide_duration': as_dict.get('hideDuration', None),
-            'label_style': as_dict.get('labelStyle', None),
-            'show_duration': as_dict.get('showDuration', None),
-            'style': as_dict.get('style', None),
-        }
-
-        return kwargs
+        return cls._get_kwargs_from_field_map(as_dict)
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'hideDuration': self.hide_duration,
-            'labelStyle': self.label_style,
-            'showDuration': self.show_duration,
-            'style': self.style
-        }
-
-        return untrimmed
+        return self._to_untrimmed_dict_from_field_map()
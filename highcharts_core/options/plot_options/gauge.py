@@ -1,42 +1,100 @@
 from __future__ import annotations
-from typing import Optional, List, Any
+import sys
+from typing import Optional, List, Any, TYPE_CHECKING
 from decimal import Decimal
 
 from validator_collection import validators
 
-from highcharts_core import errors
+from highcharts_core import errors, utility_functions
 from highcharts_core.decorators import class_sensitive, validate_types
 from highcharts_core.metaclasses import HighchartsMeta
 from highcharts_core.options.plot_options.generic import GenericTypeOptions
 from highcharts_core.options.plot_options.series import SeriesOptions
-from highcharts_core.utility_classes.gradients import Gradient
-from highcharts_core.utility_classes.patterns import Pattern
 from highcharts_core.utility_classes.shadows import ShadowOptions
 
+if TYPE_CHECKING:
+    from highcharts_core.utility_classes.gradients import Gradient
+    from highcharts_core.utility_classes.patterns import Pattern
+
+_vstring = validators.string
+_vnumeric = validators.numeric
+_vinteger = validators.integer
+_viterable = validators.iterable
+
+
+def _nonneg_numeric(value):
+    """Validate that ``value`` is a non-negative number, or :obj:`None <python:None>`.
+
+    Plain :class:`int <python:int>` and :class:`float <python:float>` input - the
+    overwhelmingly common case for pixel and degree values - is range-checked inline;
+    everything else falls back to the full validator for coercion.
+
+    :param value: The value to validate.
+
+    :returns: The validated value.
+    :rtype: numeric or :obj:`None <python:None>`
+    """
+    if value is None:
+        return None
+
+    cls = value.__class__
+    if cls is int or cls is float:
+        if value < 0:
+            raise errors.HighchartsValueError(f'value expects a number greater than or '
+                                              f'equal to 0. Received: {value}')
+        return value
+
+    return _vnumeric(value, allow_empty = True, minimum = 0)
+
+
+def _validate_percentage(value, field):
+    """Validate that ``value`` is a percentage string (e.g. ``'80%'``).
+
+    :param value: The value to validate.
+
+    :param field: The name of the property being validated, used in the error message.
+    :type field: :class:`str <python:str>`
+
+    :returns: The validated percentage string, or :obj:`None <python:None>` if ``value``
+      was empty.
+    :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
+    """
+    if not value:
+        return None
+
+    value = _vstring(value)
+    if not value.endswith('%'):
+        raise errors.HighchartsValueError(f'{field} expects a percentage string. '
+                                          f'Received: {value}')
+
+    return value
+
 
 class DialOptions(HighchartsMeta):
     """Options for the dial or arrow pointer of the gauge."""
 
+    __slots__ = ('_background_color', '_base_length', '_base_width', '_border_color',
+                 '_border_width', '_path', '_radius', '_rear_length', '_top_width')
+
+    _FIELDS = (
+        ('background_color', '_background_color', sys.intern('backgroundColor')),
+        ('base_length', '_base_length', sys.intern('baseLength')),
+        ('base_width', '_base_width', sys.intern('baseWidth')),
+        ('border_color', '_border_color', sys.intern('borderColor')),
+        ('border_width', '_border_width', sys.intern('borderWidth')),
+        ('path', '_path', sys.intern('path')),
+        ('radius', '_radius', sys.intern('radius')),
+        ('rear_length', '_rear_length', sys.intern('rearLength')),
+        ('top_width', '_top_width', sys.intern('topWidth')),
+    )
+
     def __init__(self, **kwargs):
-        self._background_color = None
-        self._base_length = None
-        self._base_width = None
-        self._border_color = None
-        self._border_width = None
-        self._path = None
-        self._radius = None
-        self._rear_length = None
-        self._top_width = None
-
-        self.background_color = kwargs.get('background_color', None)
-        self.base_length = kwargs.get('base_length', None)
-        self.base_width = kwargs.get('base_width', None)
-        self.border_color = kwargs.get('border_color', None)
-        self.border_width = kwargs.get('border_width', None)
-        self.path = kwargs.get('path', None)
-        self.radius = kwargs.get('radius', None)
-        self.rear_length = kwargs.get('rear_length', None)
-        self.top_width = kwargs.get('top_width', None)
+        for field in self._FIELDS:
+            value = kwargs.get(field[0], None)
+            if value is None:
+                setattr(self, field[1], None)
+            else:
+                setattr(self, field[0], value)
 
     @property
     def background_color(self) -> Optional[str | Gradient | Pattern]:
@@ -49,7 +107,6 @@ class DialOptions(HighchartsMeta):
 
     @background_color.setter
     def background_color(self, value):
-        from highcharts_core import utility_functions
         self._background_color = utility_functions.validate_color(value)
 
     @property
@@ -63,14 +120,7 @@ class DialOptions(HighchartsMeta):
 
     @base_length.setter
     def base_length(self, value):
-        if value is None:
-            self._base_length = None
-        else:
-            value = validators.string(value)
-            if '%' not in value:
-                raise errors.HighchartsValueError(f'base_length expects a percentage '
-                                                  f'string. Received: {value}')
-            self._base_length = value
+        self._base_length = _validate_percentage(value, 'base_length')
 
     @property
     def base_width(self) -> Optional[int | float | Decimal]:
@@ -87,9 +137,7 @@ class DialOptions(HighchartsMeta):
 
     @base_width.setter
     def base_width(self, value):
-        self._base_width = validators.numeric(value,
-                                              allow_empty = True,
-                                              minimum = 0)
+        self._base_width = _nonneg_numeric(value)
 
     @property
     def border_color(self) -> Optional[str | Gradient | Pattern]:
@@ -106,7 +154,6 @@ class DialOptions(HighchartsMeta):
 
     @border_color.setter
     def border_color(self, value):
-        from highcharts_core import utility_functions
         self._border_color = utility_functions.validate_color(value)
 
     @property
@@ -119,9 +166,7 @@ class DialOptions(HighchartsMeta):
 
     @border_width.setter
     def border_width(self, value):
-        self._border_width = validators.numeric(value,
-                                                allow_empty = True,
-                                                minimum = 0)
+        self._border_width = _nonneg_numeric(value)
 
     @property
     def path(self) -> Optional[List[Any]]:
@@ -136,8 +181,10 @@ class DialOptions(HighchartsMeta):
     def path(self, value):
         if not value:
             self._path = None
+        elif isinstance(value, (list, tuple)):
+            self._path = value
         else:
-            self._path = validators.iterable(value)
+            self._path = _viterable(value)
 
     @property
     def radius(self) -> Optional[str]:
@@ -150,14 +197,7 @@ class DialOptions(HighchartsMeta):
 
     @radius.setter
     def radius(self, value):
-        if not value:
-            self._radius = None
-        else:
-            value = validators.string(value)
-            if '%' not in value:
-                raise errors.HighchartsValueError(f'radius expects a percentage string. '
-                                                  f'Received: {value}')
-            self._radius = value
+        self._radius = _validate_percentage(value, 'radius')
 
     @property
     def rear_length(self) -> Optional[str]:
@@ -171,14 +211,7 @@ class DialOptions(HighchartsMeta):
 
     @rear_length.setter
     def rear_length(self, value):
-        if not value:
-            self._rear_length = None
-        else:
-            value = validators.string(value)
-            if '%' not in value:
-                raise errors.HighchartsValueError(f'rear_length expects a percentage '
-                                                  f'string. Received: {value}')
-            self._rear_length = value
+        self._rear_length = _validate_percentage(value, 'rear_length')
 
     @property
     def top_width(self) -> Optional[int | float | Decimal]:
@@ -194,53 +227,35 @@ class DialOptions(HighchartsMeta):
 
     @top_width.setter
     def top_width(self, value):
-        self._top_width = validators.numeric(value, minimum = 0)
+        self._top_width = _nonneg_numeric(value)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'background_color': as_dict.get('backgroundColor', None),
-            'base_length': as_dict.get('baseLength', None),
-            'base_width': as_dict.get('baseWidth', None),
-            'border_color': as_dict.get('borderColor', None),
-            'border_width': as_dict.get('borderWidth', None),
-            'path': as_dict.get('path', None),
-            'radius': as_dict.get('radius', None),
-            'rear_length': as_dict.get('rearLength', None),
-            'top_width': as_dict.get('topWidth', None)
-        }
-
-        return kwargs
+        return cls._get_kwargs_from_field_map(as_dict)
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'backgroundColor': self.background_color,
-            'baseLength': self.base_length,
-            'baseWidth': self.base_width,
-            'borderColor': self.border_color,
-            'borderWidth': self.border_width,
-            'path': self.path,
-            'radius': self.radius,
-            'rearLength': self.rear_length,
-            'topWidth': self.top_width
-        }
-
-        return untrimmed
+        return self._to_untrimmed_dict_from_field_map()
 
 
 class PivotOptions(HighchartsMeta):
     """Options for the pivot or the center point of the gauge."""
 
+    __slots__ = ('_background_color', '_border_color', '_border_width', '_radius')
+
+    _FIELDS = (
+        ('background_color', '_background_color', sys.intern('backgroundColor')),
+        ('border_color', '_border_color', sys.intern('borderColor')),
+        ('border_width', '_border_width', sys.intern('borderWidth')),
+        ('radius', '_radius', sys.intern('radius')),
+    )
+
     def __init__(self, **kwargs):
-        self._background_color = None
-        self._border_color = None
-        self._border_width = None
-        self._radius = None
-
-        self.background_color = kwargs.get('background_color', None)
-        self.border_color = kwargs.get('border_color', None)
-        self.border_width = kwargs.get('border_width', None)
-        self.radius = kwargs.get('radius', None)
+        for field in self._FIELDS:
+            value = kwargs.get(field[0], None)
+            if value is None:
+                setattr(self, field[1], None)
+            else:
+                setattr(self, field[0], value)
 
     @property
     def background_color(self) -> Optional[str | Gradient | Pattern]:
@@ -253,7 +268,6 @@ class PivotOptions(HighchartsMeta):
 
     @background_color.setter
     def background_color(self, value):
-        from highcharts_core import utility_functions
         self._background_color = utility_functions.validate_color(value)
 
     @property
@@ -271,7 +285,6 @@ class PivotOptions(HighchartsMeta):
 
     @border_color.setter
     def border_color(self, value):
-        from highcharts_core import utility_functions
         self._border_color = utility_functions.validate_color(value)
 
     @property
@@ -284,9 +297,7 @@ class PivotOptions(HighchartsMeta):
 
     @border_width.setter
     def border_width(self, value):
-        self._border_width = validators.numeric(value,
-                                                allow_empty = True,
-                                                minimum = 0)
+        self._border_width = _nonneg_numeric(value)
 
     @property
     def radius(self) -> Optional[int | float | Decimal]:
@@ -298,28 +309,14 @@ class PivotOptions(HighchartsMeta):
 
     @radius.setter
     def radius(self, value):
-        self._radius = validators.numeric(value, allow_empty = True)
+        self._radius = _vnumeric(value, allow_empty = True)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'background_color': as_dict.get('backgroundColor', None),
-            'border_color': as_dict.get('borderColor', None),
-            'border_width': as_dict.get('borderWidth', None),
-            'radius': as_dict.get('radius', None)
-        }
-
-        return kwargs
+        return cls._get_kwargs_from_field_map(as_dict)
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'backgroundColor': self.background_color,
-            'borderColor': self.border_color,
-            'borderWidth': self.border_width,
-            'radius': self.radius
-        }
-
-        return untrimmed
+        return self._to_untrimmed_dict_from_field_map()
 
 
 class GaugeOptions(GenericTypeOptions):
@@ -334,34 +331,33 @@ class GaugeOptions(GenericTypeOptions):
 
     """
 
+    __slots__ = ('_color_index', '_crisp', '_dial', '_linecap', '_line_width',
+                 '_overshoot', '_pivot', '_point_interval', '_point_interval_unit',
+                 '_point_start', '_relative_x_value', '_shadow', '_wrap')
+
+    _FIELDS = (
+        ('color_index', '_color_index', sys.intern('colorIndex')),
+        ('crisp', '_crisp', sys.intern('crisp')),
+        ('dial', '_dial', sys.intern('dial')),
+        ('linecap', '_linecap', sys.intern('linecap')),
+        ('line_width', '_line_width', sys.intern('lineWidth')),
+        ('overshoot', '_overshoot', sys.intern('overshoot')),
+        ('pivot', '_pivot', sys.intern('pivot')),
+        ('point_interval', '_point_interval', sys.intern('pointInterval')),
+        ('point_interval_unit', '_point_interval_unit', sys.intern('pointIntervalUnit')),
+        ('point_start', '_point_start', sys.intern('pointStart')),
+        ('relative_x_value', '_relative_x_value', sys.intern('relativeXValue')),
+        ('shadow', '_shadow', sys.intern('shadow')),
+        ('wrap', '_wrap', sys.intern('wrap')),
+    )
+
     def __init__(self, **kwargs):
-        self._color_index = None
-        self._crisp = None
-        self._dial = None
-        self._linecap = None
-        self._line_width = None
-        self._overshoot = None
-        self._pivot = None
-        self._point_interval = None
-        self._point_interval_unit = None
-        self._point_start = None
-        self._relative_x_value = None
-        self._shadow = None
-        self._wrap = None
-
-        self.color_index = kwargs.get('color_index', None)
-        self.crisp = kwargs.get('crisp', None)
-        self.dial = kwargs.get('dial', None)
-        self.linecap = kwargs.get('linecap', None)
-        self.line_width = kwargs.get('line_width', None)
-        self.overshoot = kwargs.get('overshoot', None)
-        self.pivot = kwargs.get('pivot', None)
-        self.point_interval = kwargs.get('point_interval', None)
-        self.point_interval_unit = kwargs.get('point_interval_unit', None)
-        self.point_start = kwargs.get('point_start', None)
-        self.relative_x_value = kwargs.get('relative_x_value', None)
-        self.shadow = kwargs.get('shadow', None)
-        self.wrap = kwargs.get('wrap', None)
+        for field in self._FIELDS:
+            value = kwargs.get(field[0], None)
+            if value is None:
+                setattr(self, field[1], None)
+            else:
+                setattr(self, field[0], value)
 
         super().__init__(**kwargs)
 
@@ -379,9 +375,9 @@ class GaugeOptions(GenericTypeOptions):
 
     @color_index.setter
     def color_index(self, value):
-        self._color_index = validators.integer(value,
-                                               allow_empty = True,
-                                               minimum = 0)
+        self._color_index = _vinteger(value,
+                                      allow_empty = True,
+                                      minimum = 0)
 
     @property
     def crisp(self) -> Optional[bool]:
@@ -401,10 +397,7 @@ class GaugeOptions(GenericTypeOptions):
 
     @crisp.setter
     def crisp(self, value):
-        if value is None:
-            self._crisp = None
-        else:
-            self._crisp = bool(value)
+        self._crisp = None if value is None else bool(value)
 
     @property
     def dial(self) -> Optional[DialOptions]:
@@ -431,7 +424,7 @@ class GaugeOptions(GenericTypeOptions):
 
     @linecap.setter
     def linecap(self, value):
-        self._linecap = validators.string(value, allow_empty = True)
+        self._linecap = _vstring(value, allow_empty = True)
 
     @property
     def line_width(self) -> Optional[int | float | Decimal]:
@@ -443,9 +436,7 @@ class GaugeOptions(GenericTypeOptions):
 
     @line_width.setter
     def line_width(self, value):
-        self._line_width = validators.numeric(value,
-                                              allow_empty = True,
-                                              minimum = 0)
+        self._line_width = _nonneg_numeric(value)
 
     @property
     def overshoot(self) -> Optional[int | float | Decimal]:
@@ -463,9 +454,7 @@ class GaugeOptions(GenericTypeOptions):
 
     @overshoot.setter
     def overshoot(self, value):
-        self._overshoot = validators.numeric(value,
-                                             allow_empty = True,
-                                             minimum = 0)
+        self._overshoot = _nonneg_numeric(value)
 
     @property
     def pivot(self) -> Optional[PivotOptions]:
@@ -512,9 +501,7 @@ class GaugeOptions(GenericTypeOptions):
 
     @point_interval.setter
     def point_interval(self, value):
-        self._point_interval = validators.numeric(value,
-                                                  allow_empty = True,
-                                                  minimum = 0)
+        self._point_interval = _nonneg_numeric(value)
 
     @property
     def point_interval_unit(self) -> Optional[str]:
@@ -539,7 +526,7 @@ class GaugeOptions(GenericTypeOptions):
 
     @point_interval_unit.setter
     def point_interval_unit(self, value):
-        self._point_interval_unit = validators.string(value, allow_empty = True)
+        self._point_interval_unit = _vstring(value, allow_empty = True)
 
     @property
     def point_start(self) -> Optional[int | float | Decimal]:
@@ -560,7 +547,7 @@ class GaugeOptions(GenericTypeOptions):
 
     @point_start.setter
     def point_start(self, value):
-        self._point_start = validators.numeric(value, allow_empty = True)
+        self._point_start = _vnumeric(value, allow_empty = True)
 
     @property
     def relative_x_value(self) -> Optional[bool]:
@@ -582,10 +569,7 @@ class GaugeOptions(GenericTypeOptions):
 
     @relative_x_value.setter
     def relative_x_value(self, value):
-        if value is None:
-            self._relative_x_value = None
-        else:
-            self._relative_x_value = bool(value)
+        self._relative_x_value = None if value is None else bool(value)
 
     @property
     def shadow(self) -> Optional[bool | ShadowOptions]:
@@ -606,6 +590,8 @@ class GaugeOptions(GenericTypeOptions):
             self._shadow = value
         elif not value:
             self._shadow = None
+        elif isinstance(value, ShadowOptions):
+            self._shadow = value
         else:
             value = validate_types(value,
                                    types = ShadowOptions)
@@ -625,10 +611,7 @@ class GaugeOptions(GenericTypeOptions):
 
     @wrap.setter
     def wrap(self, value):
-        if value is None:
-            self._wrap = None
-        else:
-            self._wrap = bool(value)
+        self._wrap = None if value is None else bool(value)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
@@ -643,42 +626,8 @@ class GaugeOptions(GenericTypeOptions):
         :rtype: :class:`dict <python:dict>`
 
         """
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'allow_point_select': as_dict.get('allowPointSelect', None),
-            'animation': as_dict.get('animation', None),
-            'class_name': as_dict.get('className', None),
-            'clip': as_dict.get('clip', None),
-            'color': as_dict.get('color', None),
-            'cursor': as_dict.get('cursor', None),
-            'custom': as_dict.get('custom', None),
-            'dash_style': as_dict.get('dashStyle', None),
-            'data_labels': as_dict.get('dataLabels', None),
-            'description': as_dict.get('description', None),
-            'enable_mouse_tracking': as_dict.get('enableMouseTracking', None),
-            'events': as_dict.get('events', None),
-            'include_in_data_export': as_dict.get('includeInDataExport', None),
-            'keys': as_dict.get('keys', None),
-            'label': as_dict.get('label', None),
-            'legend_symbol': as_dict.get('legendSymbol', None),
-            'linked_to': as_dict.get('linkedTo', None),
-            'marker': as_dict.get('marker', None),
-            'on_point': as_dict.get('onPoint', None),
-            'opacity': as_dict.get('opacity', None),
-            'point': as_dict.get('point', None),
-            'point_description_formatter': as_dict.get('pointDescriptionFormatter', None),
-            'selected': as_dict.get('selected', None),
-            'show_checkbox': as_dict.get('showCheckbox', None),
-            'show_in_legend': as_dict.get('showInLegend', None),
-            'skip_keyboard_navigation': as_dict.get('skipKeyboardNavigation', None),
-            'sonification': as_dict.get('sonification', None),
-            'states': as_dict.get('states', None),
-            'sticky_tracking': as_dict.get('stickyTracking', None),
-            'threshold': as_dict.get('threshold', None),
-            'tooltip': as_dict.get('tooltip', None),
-            'turbo_threshold': as_dict.get('turboThreshold', None),
-            'visible': as_dict.get('visible', None),
-
+        kwargs = GenericTypeOptions._get_kwargs_from_dict(as_dict)
+        kwargs.update({
             'color_index': as_dict.get('colorIndex', None),
             'crisp': as_dict.get('crisp', None),
             'linecap': as_dict.get('linecap', None),
@@ -694,7 +643,7 @@ class GaugeOptions(GenericTypeOptions):
             'overshoot': as_dict.get('overshoot', None),
             'pivot': as_dict.get('pivot', None),
             'wrap': as_dict.get('wrap', None)
-        }
+        })
 
         return kwargs
 
@@ -714,10 +663,7 @@ class GaugeOptions(GenericTypeOptions):
             'shadow': self.shadow,
             'wrap': self.wrap
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
 
@@ -734,12 +680,9 @@ class SolidGaugeOptions(SeriesOptions):
 
     """
 
-    def __init__(self, **kwargs):
-        self._inner_radius = None
-        self._overshoot = None
-        self._radius = None
-        self._rounded = None
+    __slots__ = ('_inner_radius', '_overshoot', '_radius', '_rounded')
 
+    def __init__(self, **kwargs):
         self.inner_radius = kwargs.get('inner_radius', None)
         self.overshoot = kwargs.get('overshoot', None)
         self.radius = kwargs.get('radius', None)
@@ -760,17 +703,14 @@ class SolidGaugeOptions(SeriesOptions):
     def inner_radius(self, value):
         if value is None:
             self._inner_radius = None
-        else:
-            try:
-                value = validators.string(value)
-                if '%' not in value:
-                    raise errors.HighchartsValueError('inner_radius expects either a '
-                                                      'number or a percentage % string. '
-                                                      'No "%" character found.')
-            except TypeError:
-                value = validators.numeric(value, minimum = 0)
-
+        elif isinstance(value, str):
+            if '%' not in value:
+                raise errors.HighchartsValueError('inner_radius expects either a '
+                                                  'number or a percentage % string. '
+                                                  'No "%" character found.')
             self._inner_radius = value
+        else:
+            self._inner_radius = _vnumeric(value, minimum = 0)
 
     @property
     def overshoot(self) -> Optional[int | float | Decimal]:
@@ -788,9 +728,7 @@ class SolidGaugeOptions(SeriesOptions):
 
     @overshoot.setter
     def overshoot(self, value):
-        self._overshoot = validators.numeric(value,
-                                             allow_empty = True,
-                                             minimum = 0)
+        self._overshoot = _nonneg_numeric(value)
 
     @property
     def radius(self) -> Optional[str | int | float | Decimal]:
@@ -805,17 +743,14 @@ class SolidGaugeOptions(SeriesOptions):
     def radius(self, value):
         if value is None:
             self._radius = None
-        else:
-            try:
-                value = validators.string(value)
-                if '%' not in value:
-                    raise errors.HighchartsValueError('radius expects either a number or '
-                                                      'a percentage string. No "%" '
-                                                      'character found.')
-            except TypeError:
-                value = validators.numeric(value, minimum = 0)
-
+        elif isinstance(value, str):
+            if '%' not in value:
+                raise errors.HighchartsValueError('radius expects either a number or '
+                                                  'a percentage string. No "%" '
+                                                  'character found.')
             self._radius = value
+        else:
+            self._radius = _vnumeric(value, minimum = 0)
 
     @property
     def rounded(self) -> Optional[bool]:
@@ -827,84 +762,17 @@ class SolidGaugeOptions(SeriesOptions):
 
     @rounded.setter
     def rounded(self, value):
-        if value is None:
-            self._rounded = None
-        else:
-            self._rounded = bool(value)
+        self._rounded = None if value is None else bool(value)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'allow_point_select': as_dict.get('allowPointSelect', None),
-            'animation': as_dict.get('animation', None),
-            'class_name': as_dict.get('className', None),
-            'clip': as_dict.get('clip', None),
-            'color': as_dict.get('color', None),
-            'cursor': as_dict.get('cursor', None),
-            'custom': as_dict.get('custom', None),
-            'dash_style': as_dict.get('dashStyle', None),
-            'data_labels': as_dict.get('dataLabels', None),
-            'description': as_dict.get('description', None),
-            'enable_mouse_tracking': as_dict.get('enableMouseTracking', None),
-            'events': as_dict.get('events', None),
-            'include_in_data_export': as_dict.get('includeInDataExport', None),
-            'keys': as_dict.get('keys', None),
-            'label': as_dict.get('label', None),
-            'legend_symbol': as_dict.get('legendSymbol', None),
-            'linked_to': as_dict.get('linkedTo', None),
-            'marker': as_dict.get('marker', None),
-            'on_point': as_dict.get('onPoint', None),
-            'opacity': as_dict.get('opacity', None),
-            'point': as_dict.get('point', None),
-            'point_description_formatter': as_dict.get('pointDescriptionFormatter', None),
-            'selected': as_dict.get('selected', None),
-            'show_checkbox': as_dict.get('showCheckbox', None),
-            'show_in_legend': as_dict.get('showInLegend', None),
-            'skip_keyboard_navigation': as_dict.get('skipKeyboardNavigation', None),
-            'sonification': as_dict.get('sonification', None),
-            'states': as_dict.get('states', None),
-            'sticky_tracking': as_dict.get('stickyTracking', None),
-            'threshold': as_dict.get('threshold', None),
-            'tooltip': as_dict.get('tooltip', None),
-            'turbo_threshold': as_dict.get('turboThreshold', None),
-            'visible': as_dict.get('visible', None),
-
-            'animation_limit': as_dict.get('animationLimit', None),
-            'boost_blending': as_dict.get('boostBlending', None),
-            'boost_threshold': as_dict.get('boostThreshold', None),
-            'color_axis': as_dict.get('colorAxis', None),
-            'color_index': as_dict.get('colorIndex', None),
-            'color_key': as_dict.get('colorKey', None),
-            'connect_ends': as_dict.get('connectEnds', None),
-            'connect_nulls': as_dict.get('connectNulls', None),
-            'crisp': as_dict.get('crisp', None),
-            'crop_threshold': as_dict.get('cropThreshold', None),
-            'data_sorting': as_dict.get('dataSorting', None),
-            'drag_drop': as_dict.get('dragDrop', None),
-            'find_nearest_point_by': as_dict.get('findNearestPointBy', None),
-            'get_extremes_from_all': as_dict.get('getExtremesFromAll', None),
-            'inactive_other_points': as_dict.get('inactiveOtherPoints', None),
-            'linecap': as_dict.get('linecap', None),
-            'line_width': as_dict.get('lineWidth', None),
-            'negative_color': as_dict.get('negativeColor', None),
-            'point_description_format': as_dict.get('pointDescriptionFormat', None),
-            'point_interval': as_dict.get('pointInterval', None),            'point_interval_unit': as_dict.get('pointIntervalUnit', None),
-            'point_placement': as_dict.get('pointPlacement', None),
-            'point_start': as_dict.get('pointStart', None),
-            'relative_x_value': as_dict.get('relativeXValue', None),
-            'shadow': as_dict.get('shadow', None),
-            'soft_threshold': as_dict.get('softThreshold', None),
-            'stacking': as_dict.get('stacking', None),
-            'step': as_dict.get('step', None),
-            'zone_axis': as_dict.get('zoneAxis', None),
-            'zones': as_dict.get('zones', None),
-
+        kwargs = SeriesOptions._get_kwargs_from_dict(as_dict)
+        kwargs.update({
             'inner_radius': as_dict.get('innerRadius', None),
             'overshoot': as_dict.get('overshoot', None),
             'radius': as_dict.get('radius', None),
-            'rounded': as_dict.get('rounded', None)
-        }
+            'rounded': as_dict.get('rounded', None),
+        })
 
         return kwargs
 
@@ -915,9 +783,6 @@ class SolidGaugeOptions(SeriesOptions):
             'radius': self.radius,
             'rounded': self.rounded
         }
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls)
-
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
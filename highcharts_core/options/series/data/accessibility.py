@@ -1,4 +1,5 @@
 from __future__ import annotations
+import sys
 from typing import Optional
 
 from validator_collection import validators
@@ -9,12 +10,20 @@ from highcharts_core.metaclasses import HighchartsMeta
 class DataPointAccessibility(HighchartsMeta):
     """Accessibility options for a series."""
 
-    def __init__(self, **kwargs):
-        self._description = None
-        self._enabled = None
+    __slots__ = ('_description', '_enabled')
+
+    _FIELDS = (
+        ('description', '_description', sys.intern('description')),
+        ('enabled', '_enabled', sys.intern('enabled')),
+    )
 
-        self.description = kwargs.get('description', None)
-        self.enabled = kwargs.get('enabled', None)
+    def __init__(self, **kwargs):
+        for field in self._FIELDS:
+            value = kwargs.get(field[0], None)
+            if value is None:
+                setattr(self, field[1], None)
+            else:
+                setattr(self, field[0], value)
 
     @property
     def description(self) -> Optional[str]:
@@ -26,7 +35,12 @@ class DataPointAccessibility(HighchartsMeta):
 
     @description.setter
     def description(self, value):
-        self._description = validators.string(value, allow_empty = True)
+        if not value:
+            self._description = None
+        elif isinstance(value, str):
+            self._description = value
+        else:
+            self._description = validators.string(value, allow_empty = True)
 
     @property
     def enabled(self) -> Optional[bool]:
@@ -45,17 +59,7 @@ class DataPointAccessibility(HighchartsMeta):
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'description': as_dict.get('description', None),
-            'enabled': as_dict.get('enabled', None),
-        }
-
-        return kwargs
+        return cls._get_kwargs_from_field_map(as_dict)
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'description': self.description,
-            'enabled': self.enabled,
-        }
-
-        return untrimmed
+        return self._to_untrimmed_dict_from_field_map()
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import sys
 from typing import Optional, List
 from decimal import Decimal
 
@@ -15,10 +16,26 @@ from highcharts_core.utility_classes.data_labels import DataLabel
 class ConnectionBase(DataBase):
     """Data point that represents a connection ``from`` one data point, ``to`` another."""
 
-    def __init__(self, **kwargs):
-        self._from_ = None
-        self._to = None
+    __slots__ = ('_from_', '_to')
+
+    _UNTRIMMED_PAIRS = (
+        (sys.intern('from'), 'from_'),
+        (sys.intern('to'), 'to'),
+
+        (sys.intern('accessibility'), 'accessibility'),
+        (sys.intern('className'), 'class_name'),
+        (sys.intern('color'), 'color'),
+        (sys.intern('colorIndex'), 'color_index'),
+        (sys.intern('custom'), 'custom'),
+        (sys.intern('description'), 'description'),
+        (sys.intern('events'), 'events'),
+        (sys.intern('id'), 'id'),
+        (sys.intern('labelrank'), 'label_rank'),
+        (sys.intern('name'), 'name'),
+        (sys.intern('selected'), 'selected'),
+    )
 
+    def __init__(self, **kwargs):
         self.from_ = kwargs.get('from_', None)
         self.to = kwargs.get('to', None)
 
@@ -61,19 +78,21 @@ class ConnectionBase(DataBase):
             value = [value]
 
         collection = []
+        append = collection.append
+        from_dict = cls.from_dict
         for item in value:
-            if checkers.is_type(item, cls):
+            if isinstance(item, cls):
                 as_obj = item
-            elif checkers.is_dict(item):
-                as_obj = cls.from_dict(item)
-            elif item is None or isinstance(item, constants.EnforcedNullType):
+            elif isinstance(item, dict):
+                as_obj = from_dict(item)
+            elif item is None or item is constants.EnforcedNull:
                 as_obj = cls()
             else:
                 raise errors.HighchartsValueError(f'each data point supplied must either '
                                                   f'be a Connection Data Point or be '
                                                   f'coercable to one. Could not coerce: '
                                                   f'{item}')
-            collection.append(as_obj)
+            append(as_obj)
 
         return collection
 
@@ -112,33 +131,17 @@ class ConnectionBase(DataBase):
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'from': self.from_,
-            'to': self.to,
-
-            'accessibility': self.accessibility,
-            'className': self.class_name,
-            'color': self.color,
-            'colorIndex': self.color_index,
-            'custom': self.custom,
-            'description': self.description,
-            'events': self.events,
-            'id': self.id,
-            'labelrank': self.label_rank,
-            'name': self.name,
-            'selected': self.selected,
-        }
-
-        return untrimmed
+        return {pair[0]: value
+                for pair in ConnectionBase._UNTRIMMED_PAIRS
+                if (value := getattr(self, pair[1])) is not None}
 
 
 class ConnectionData(ConnectionBase):
     """Data point that represents a connection ``from`` one data point, ``to`` another."""
 
-    def __init__(self, **kwargs):
-        self._data_labels = None
-        self._drag_drop = None
+    __slots__ = ('_data_labels', '_drag_drop')
 
+    def __init__(self, **kwargs):
         self.data_labels = kwargs.get('data_labels', None)
         self.drag_drop = kwargs.get('drag_drop', None)
 
@@ -197,12 +200,14 @@ class ConnectionData(ConnectionBase):
             value = [value]
 
         collection = []
+        append = collection.append
+        from_dict = cls.from_dict
         for item in value:
-            if checkers.is_type(item, 'ConnectionData'):
+            if isinstance(item, ConnectionData):
                 as_obj = item
-            elif checkers.is_dict(item):
-                as_obj = cls.from_dict(item)
-            elif item is None or isinstance(item, constants.EnforcedNullType):
+            elif isinstance(item, dict):
+                as_obj = from_dict(item)
+            elif item is None or item is constants.EnforcedNull:
                 as_obj = cls()
             elif len(item) == 2:
                 as_obj = cls(from_ = item[0],
@@ -212,7 +217,7 @@ class ConnectionData(ConnectionBase):
                                                   f'be a Connection Data Point or be '
                                                   f'coercable to one. Could not coerce: '
                                                   f'{item}')
-            collection.append(as_obj)
+            append(as_obj)
 
         return collection
 
@@ -291,14 +296,13 @@ class ConnectionData(ConnectionBase):
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'dataLabels': self.data_labels,
-            'dragDrop': self.drag_drop,
-        }
+        untrimmed = {}
+        if self.data_labels is not None:
+            untrimmed['dataLabels'] = self.data_labels
+        if self.drag_drop is not None:
+            untrimmed['dragDrop'] = self.drag_drop
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
 
@@ -317,9 +321,15 @@ class WeightedConnectionData(ConnectionData):
     """Variant of :class:`ConnectionData` that also applies a ``weight`` to the
     connection."""
 
-    def __init__(self, **kwargs):
-        self._weight = None
+    __slots__ = ('_weight',)
 
+    _UNTRIMMED_PAIRS = (
+        (sys.intern('weight'), 'weight'),
+        (sys.intern('dataLabels'), 'data_labels'),
+        (sys.intern('dragDrop'), 'drag_drop'),
+    ) + ConnectionBase._UNTRIMMED_PAIRS
+
+    def __init__(self, **kwargs):
         self.weight = kwargs.get('weight', None)
 
         super().__init__(**kwargs)
@@ -334,7 +344,10 @@ class WeightedConnectionData(ConnectionData):
 
     @weight.setter
     def weight(self, value):
-        self._weight = validators.numeric(value, allow_empty = True)
+        if value.__class__ is int or value.__class__ is float:
+            self._weight = value
+        else:
+            self._weight = validators.numeric(value, allow_empty = True)
 
     @classmethod
     def from_list(cls, value):
@@ -355,19 +368,21 @@ class WeightedConnectionData(ConnectionData):
             value = [value]
 
         collection = []
+        append = collection.append
+        from_dict = cls.from_dict
         for item in value:
-            if checkers.is_type(item, 'ConnectionData'):
+            if isinstance(item, ConnectionData):
                 as_obj = item
-            elif checkers.is_dict(item):
-                as_obj = cls.from_dict(item)
-            elif item is None or isinstance(item, constants.EnforcedNullType):
+            elif isinstance(item, dict):
+                as_obj = from_dict(item)
+            elif item is None or item is constants.EnforcedNull:
                 as_obj = cls()
             else:
                 raise errors.HighchartsValueError(f'each data point supplied must either '
                                                   f'be a Connection Data Point or be '
                                                   f'coercable to one. Could not coerce: '
                                                   f'{item}')
-            collection.append(as_obj)
+            append(as_obj)
 
         return collection
 
@@ -445,29 +460,9 @@ class WeightedConnectionData(ConnectionData):
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'weight': self.weight,
-
-            'dataLabels': self.data_labels,
-            'dragDrop': self.drag_drop,
-
-            'from': self.from_,
-            'to': self.to,
-
-            'accessibility': self.accessibility,
-            'className': self.class_name,
-            'color': self.color,
-            'colorIndex': self.color_index,
-            'custom': self.custom,
-            'description': self.description,
-            'events': self.events,
-            'id': self.id,
-            'labelrank': self.label_rank,
-            'name': self.name,
-            'selected': self.selected
-        }
-
-        return untrimmed
+        return {pair[0]: value
+                for pair in WeightedConnectionData._UNTRIMMED_PAIRS
+                if (value := getattr(self, pair[1])) is not None}
 
 
 class WeightedConnectionDataCollection(DataPointCollection):
@@ -483,9 +478,9 @@ class WeightedConnectionDataCollection(DataPointCollection):
 class OutgoingWeightedConnectionData(WeightedConnectionData):
     """Variant of :class:`WeightedConnectionData` that supports the ``outoging`` flag."""
 
-    def __init__(self, **kwargs):
-        self._outgoing = None
+    __slots__ = ('_outgoing',)
 
+    def __init__(self, **kwargs):
         self.outgoing = kwargs.get('outgoing', None)
 
         super().__init__(**kwargs)
@@ -526,19 +521,21 @@ class OutgoingWeightedConnectionData(WeightedConnectionData):
             value = [value]
 
         collection = []
+        append = collection.append
+        from_dict = cls.from_dict
         for item in value:
-            if checkers.is_type(item, 'OutgoingWeightedConnectionData'):
+            if isinstance(item, OutgoingWeightedConnectionData):
                 as_obj = item
-            elif checkers.is_dict(item):
-                as_obj = cls.from_dict(item)
-            elif item is None or isinstance(item, constants.EnforcedNullType):
+            elif isinstance(item, dict):
+                as_obj = from_dict(item)
+            elif item is None or item is constants.EnforcedNull:
                 as_obj = cls()
             else:
                 raise errors.HighchartsValueError(f'each data point supplied must either '
                                                   f'be a Connection Data Point or be '
                                                   f'coercable to one. Could not coerce: '
                                                   f'{item}')
-            collection.append(as_obj)
+            append(as_obj)
 
         return collection
 
@@ -593,13 +590,11 @@ class OutgoingWeightedConnectionData(WeightedConnectionData):
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'outgoing': self.outgoing
-        }
+        untrimmed = {}
+        if self.outgoing is not None:
+            untrimmed['outgoing'] = self.outgoing
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
+        untrimmed.update(super()._to_untrimmed_dict(in_cls = in_cls))
 
         return untrimmed
 
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import sys
 from typing import Optional, List, Dict
 from decimal import Decimal
 
@@ -13,10 +14,33 @@ class VectorData(CartesianData):
     """Variant of :class:`CartesianData` which extends the data point with ``direction``
     and ``length`` attributes."""
 
-    def __init__(self, **kwargs):
-        self._direction = None
-        self._length = None
+    __slots__ = ('_direction', '_length')
+
+    _UNTRIMMED_PAIRS = (
+        (sys.intern('direction'), 'direction'),
+        (sys.intern('length'), 'length'),
+
+        (sys.intern('dataLabels'), 'data_labels'),
+        (sys.intern('dragDrop'), 'drag_drop'),
+        (sys.intern('drilldown'), 'drilldown'),
+        (sys.intern('marker'), 'marker'),
+        (sys.intern('x'), 'x'),
+        (sys.intern('y'), 'y'),
+
+        (sys.intern('accessibility'), 'accessibility'),
+        (sys.intern('className'), 'class_name'),
+        (sys.intern('color'), 'color'),
+        (sys.intern('colorIndex'), 'color_index'),
+        (sys.intern('custom'), 'custom'),
+        (sys.intern('description'), 'description'),
+        (sys.intern('events'), 'events'),
+        (sys.intern('id'), 'id'),
+        (sys.intern('labelrank'), 'label_rank'),
+        (sys.intern('name'), 'name'),
+        (sys.intern('selected'), 'selected'),
+    )
 
+    def __init__(self, **kwargs):
         self.direction = kwargs.get('direction', None)
         self.length = kwargs.get('length', None)
 
@@ -33,7 +57,10 @@ class VectorData(CartesianData):
 
     @direction.setter
     def direction(self, value):
-        self._direction = validators.numeric(value, allow_empty = True)
+        if value.__class__ is int or value.__class__ is float:
+            self._direction = value
+        else:
+            self._direction = validators.numeric(value, allow_empty = True)
 
     @property
     def length(self) -> Optional[int | float | Decimal]:
@@ -50,7 +77,10 @@ class VectorData(CartesianData):
 
     @length.setter
     def length(self, value):
-        self._length = validators.numeric(value, allow_empty = True)
+        if value.__class__ is int or value.__class__ is float:
+            self._length = value
+        else:
+            self._length = validators.numeric(value, allow_empty = True)
 
     @classmethod
     def from_list(cls, value):
@@ -65,12 +95,14 @@ class VectorData(CartesianData):
             value = [value]
 
         collection = []
+        append = collection.append
+        from_dict = cls.from_dict
         for item in value:
-            if checkers.is_type(item, 'VectorData'):
+            if isinstance(item, VectorData):
                 as_obj = item
-            elif checkers.is_dict(item):
-                as_obj = cls.from_dict(item)
-            elif item is None or isinstance(item, constants.EnforcedNullType):
+            elif isinstance(item, dict):
+                as_obj = from_dict(item)
+            elif item is None or item is constants.EnforcedNull:
                 as_obj = cls()
             elif len(item) == 4:
                 as_obj = cls(x = item[0],
@@ -91,7 +123,7 @@ class VectorData(CartesianData):
             if checkers.is_string(as_obj.x) and not as_obj.name:
                 as_obj.name = as_obj.x
                 as_obj.x = None
-            collection.append(as_obj)
+            append(as_obj)
 
         return collection
 
@@ -221,31 +253,9 @@ class VectorData(CartesianData):
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'direction': self.direction,
-            'length': self.length,
-
-            'dataLabels': self.data_labels,
-            'dragDrop': self.drag_drop,
-            'drilldown': self.drilldown,
-            'marker': self.marker,
-            'x': self.x,
-            'y': self.y,
-
-            'accessibility': self.accessibility,
-            'className': self.class_name,
-            'color': self.color,
-            'colorIndex': self.color_index,
-            'custom': self.custom,
-            'description': self.description,
-            'events': self.events,
-            'id': self.id,
-            'labelrank': self.label_rank,
-            'name': self.name,
-            'selected': self.selected,
-        }
-
-        return untrimmed
+        return {pair[0]: value
+                for pair in VectorData._UNTRIMMED_PAIRS
+                if (value := getattr(self, pair[1])) is not None}
 
 
 class VectorDataCollection(DataPointCollection):
@@ -1,26 +1,49 @@
 from __future__ import annotations
-from typing import Optional
-from decimal import Decimal
+import sys
+from typing import Optional, TYPE_CHECKING
 
 from validator_collection import validators
 
-from highcharts_core import constants, errors
+from highcharts_core import errors
 from highcharts_core.decorators import class_sensitive
 from highcharts_core.metaclasses import HighchartsMeta
 from highcharts_core.utility_classes.events import BreadcrumbEvents
 from highcharts_core.utility_classes.position import Position
 from highcharts_core.utility_classes.javascript_functions import CallbackFunction
 
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+_vdict = validators.dict
+_vinteger = validators.integer
+_vnumeric = validators.numeric
+_vstring = validators.string
+
+_RELATIVE_TO_VALUES = {
+    'plot': 'plot',
+    'chart': 'chart',
+    'plotbox': 'plotBox',
+    'spacingbox': 'spacingBox',
+}
+
 
 class Separator(HighchartsMeta):
     """Configuration object for the Breadcrumbs Separator."""
 
-    def __init__(self, **kwargs):
-        self._style = None
-        self._text = None
+    __slots__ = ('_style', '_text')
+
+    _FIELDS = (
+        ('style', '_style', sys.intern('style')),
+        ('text', '_text', sys.intern('text')),
+    )
 
-        self.style = kwargs.get('style', None)
-        self.text = kwargs.get('text', None)
+    def __init__(self, **kwargs):
+        for field in self._FIELDS:
+            value = kwargs.get(field[0], None)
+            if value is None:
+                setattr(self, field[1], None)
+            else:
+                setattr(self, field[0], value)
 
     @property
     def style(self) -> Optional[dict]:
@@ -32,7 +55,10 @@ class Separator(HighchartsMeta):
 
     @style.setter
     def style(self, value):
-        self._style = validators.dict(value)
+        if value is None:
+            self._style = None
+        else:
+            self._style = _vdict(value)
 
     @property
     def text(self) -> Optional[str]:
@@ -45,60 +71,51 @@ class Separator(HighchartsMeta):
 
     @text.setter
     def text(self, value):
-        self._text = validators.string(value, allow_empty = True)
+        if value is None:
+            self._text = None
+        else:
+            self._text = _vstring(value, allow_empty = True)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'style': as_dict.get('style', None),
-            'text': as_dict.get('text', None),
-        }
-
-        return kwargs
+        return cls._get_kwargs_from_field_map(as_dict)
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'style': self.style,
-            'text': self.text
-        }
-
-        return untrimmed
+        return self._to_untrimmed_dict_from_field_map()
 
 
 class BreadcrumbOptions(HighchartsMeta):
     """Configuration for the breadcrumbs, the navigation at the top leading the way
     up through the drilldown levels."""
 
+    __slots__ = ('_button_spacing', '_button_theme', '_events', '_floating', '_format',
+                 '_formatter', '_position', '_relative_to', '_rtl', '_separator',
+                 '_show_full_path', '_style', '_use_html', '_z_index')
+
+    _FIELDS = (
+        ('button_spacing', '_button_spacing', sys.intern('buttonSpacing')),
+        ('button_theme', '_button_theme', sys.intern('buttonTheme')),
+        ('events', '_events', sys.intern('events')),
+        ('floating', '_floating', sys.intern('floating')),
+        ('format', '_format', sys.intern('format')),
+        ('formatter', '_formatter', sys.intern('formatter')),
+        ('position', '_position', sys.intern('position')),
+        ('relative_to', '_relative_to', sys.intern('relativeTo')),
+        ('rtl', '_rtl', sys.intern('rtl')),
+        ('separator', '_separator', sys.intern('separator')),
+        ('show_full_path', '_show_full_path', sys.intern('showFullPath')),
+        ('style', '_style', sys.intern('style')),
+        ('use_html', '_use_html', sys.intern('useHTML')),
+        ('z_index', '_z_index', sys.intern('zIndex')),
+    )
+
     def __init__(self, **kwargs):
-        self._button_spacing = None
-        self._button_theme = None
-        self._events = None
-        self._floating = None
-        self._format = None
-        self._formatter = None
-        self._position = None
-        self._relative_to = None
-        self._rtl = None
-        self._separator = None
-        self._show_full_path = None
-        self._style = None
-        self._use_html = None
-        self._z_index = None
-
-        self.button_spacing = kwargs.get('button_spacing', None)
-        self.button_theme = kwargs.get('button_theme', None)
-        self.events = kwargs.get('events', None)
-        self.floating = kwargs.get('floating', None)
-        self.format = kwargs.get('format', None)
-        self.formatter = kwargs.get('formatter', None)
-        self.position = kwargs.get('position', None)
-        self.relative_to = kwargs.get('relative_to', None)
-        self.rtl = kwargs.get('rtl', None)
-        self.separator = kwargs.get('separator', None)
-        self.show_full_path = kwargs.get('show_full_path', None)
-        self.style = kwargs.get('style', None)
-        self.use_html = kwargs.get('use_html', None)
-        self.z_index = kwargs.get('z_index', None)
+        for field in self._FIELDS:
+            value = kwargs.get(field[0], None)
+            if value is None:
+                setattr(self, field[1], None)
+            else:
+                setattr(self, field[0], value)
 
     @property
     def button_spacing(self) -> Optional[int | float | Decimal]:
@@ -111,7 +128,10 @@ class BreadcrumbOptions(HighchartsMeta):
 
     @button_spacing.setter
     def button_spacing(self, value):
-        self._button_spacing = validators.numeric(value, allow_empty = True)
+        if value is None:
+            self._button_spacing = None
+        else:
+            self._button_spacing = _vnumeric(value, allow_empty = True)
 
     @property
     def button_theme(self) -> Optional[dict]:
@@ -126,11 +146,14 @@ class BreadcrumbOptions(HighchartsMeta):
 
         :rtype: :class:`dict <python:dict>`
         """
-        return self._theme
+        return self._button_theme
 
     @button_theme.setter
     def button_theme(self, value):
-        self._theme = validators.dict(value, allow_empty = True)
+        if value is None:
+            self._button_theme = None
+        else:
+            self._button_theme = _vdict(value, allow_empty = True)
 
     @property
     def events(self) -> Optional[BreadcrumbEvents]:
@@ -177,7 +200,10 @@ class BreadcrumbOptions(HighchartsMeta):
 
     @format.setter
     def format(self, value):
-        self._format = validators.string(value, allow_empty = True)
+        if value is None:
+            self._format = None
+        else:
+            self._format = _vstring(value, allow_empty = True)
 
     @property
     def formatter(self) -> Optional[CallbackFunction]:
@@ -227,13 +253,14 @@ class BreadcrumbOptions(HighchartsMeta):
         if not value:
             self._relative_to = None
         else:
-            value = validators.string(value)
-            value = value.lower()
-            if value not in ['plot', 'chart', 'plotBox', 'spacingBox']:
+            if not isinstance(value, str):
+                value = _vstring(value)
+            try:
+                self._relative_to = _RELATIVE_TO_VALUES[value.lower()]
+            except KeyError:
                 raise errors.HighchartsValueError(f'relative_to accepts "plot", "chart", '
                                                   f'"plotBox", "spacingBox", or None. '
                                                   f'Received: {value}')
-            self._relative_to = value
 
     @property
     def rtl(self) -> Optional[bool]:
@@ -290,7 +317,10 @@ class BreadcrumbOptions(HighchartsMeta):
 
     @style.setter
     def style(self, value):
-        self._style = validators.dict(value, allow_empty = True)
+        if value is None:
+            self._style = None
+        else:
+            self._style = _vdict(value, allow_empty = True)
 
     @property
     def use_html(self) -> Optional[bool]:
@@ -322,45 +352,14 @@ class BreadcrumbOptions(HighchartsMeta):
 
     @z_index.setter
     def z_index(self, value):
-        self._z_index = validators.integer(value, allow_empty = True)
+        if value is None:
+            self._z_index = None
+        else:
+            self._z_index = _vinteger(value, allow_empty = True)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'button_spacing': as_dict.get('buttonSpacing', None),
-            'button_theme': as_dict.get('buttonTheme', None),
-            'events': as_dict.get('events', None),
-            'floating': as_dict.get('floating', None),
-            'format': as_dict.get('format', None),
-            'formatter': as_dict.get('formatter', None),
-            'position': as_dict.get('position', None),
-            'relative_to': as_dict.get('relativeTo', None),
-            'rtl': as_dict.get('rtl', None),
-            'separator': as_dict.get('separator', None),
-            'show_full_path': as_dict.get('showFullPath', None),
-            'style': as_dict.get('style', None),
-            'use_html': as_dict.get('useHTML', None),
-            'z_index': as_dict.get('zIndex', None),
-        }
-
-        return kwargs
+        return cls._get_kwargs_from_field_map(as_dict)
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
-        untrimmed = {
-            'buttonSpacing': self.button_spacing,
-            'buttonTheme': self.button_theme,
-            'events': self.events,
-            'floating': self.floating,
-            'format': self.format,
-            'formatter': self.formatter,
-            'position': self.position,
-            'relativeTo': self.relative_to,
-            'rtl': self.rtl,
-            'separator': self.separator,
-            'showFullPath': self.show_full_path,
-            'style': self.style,
-            'useHTML': self.use_html,
-            'zIndex': self.z_index
-        }
-
-        return untrimmed
+        return self._to_untrimmed_dict_from_field_map()
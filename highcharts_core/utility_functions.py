@@ -125,12 +125,16 @@ def mro__to_untrimmed_dict(obj, in_cls = None):
 
     consolidated = {}
     for item in ancestor_dicts:
-        for key in item:
-            consolidated[key] = item[key]
+        consolidated.update(item)
 
     return consolidated
 
 
+_GRADIENT_JS_KEYS = frozenset(('linearGradient', 'radialGradient'))
+_GRADIENT_PY_KEYS = frozenset(('linear_gradient', 'radial_gradient'))
+_PATTERN_JS_KEYS = frozenset(('patternOptions', 'pattern'))
+
+
 def validate_color(value):
     """Validate that ``value`` is either a :class:`Gradient`, :class:`Pattern`, or a
     :class:`str <python:str>`.
@@ -150,31 +154,37 @@ def validate_color(value):
         return value
     elif isinstance(value, (Gradient, Pattern)):
         return value
-    elif isinstance(value, (dict, str)) and ('linearGradient' in value or
-                                             'radialGradient' in value):
-        try:
-            value = Gradient.from_json(value)
-        except (TypeError, ValueError):
-            if isinstance(value, dict):
-                value = Gradient.from_dict(value)
-            else:
+    elif isinstance(value, dict):
+        keys = value.keys()
+        if keys & _GRADIENT_JS_KEYS:
+            value = Gradient.from_dict(value)
+        elif keys & _GRADIENT_PY_KEYS:
+            value = Gradient(**value)
+        elif keys & _PATTERN_JS_KEYS:
+            value = Pattern.from_dict(value)
+        elif 'pattern_options' in value:
+            value = Pattern(**value)
+        else:
+            raise errors.HighchartsValueError(f'Unable to resolve value to a string, '
+                                              f'Gradient, or Pattern. Value received '
+                                              f'was: {value}')
+    elif isinstance(value, str):
+        if '{' not in value:
+            # plain color strings ('#ccc', 'rgb(...)', named colors) can never be
+            # gradient or pattern payloads, which are JSON/JS object literals
+            value = validators.string(value)
+        elif 'linearGradient' in value or 'radialGradient' in value:
+            try:
+                value = Gradient.from_json(value)
+            except (TypeError, ValueError):
                 value = validators.string(value)
-    elif isinstance(value, dict) and ('linear_gradient' in value or
-                                      'radial_gradient' in value):
-        value = Gradient(**value)
-    elif isinstance(value, (dict, str)) and ('patternOptions' in value or
-                                             'pattern' in value):
-        try:
-            value = Pattern.from_json(value)
-        except (TypeError, ValueError):
-            if isinstance(value, dict):
-                value = Pattern.from_dict(value)
-            else:
+        elif 'patternOptions' in value or 'pattern' in value:
+            try:
+                value = Pattern.from_json(value)
+            except (TypeError, ValueError):
                 value = validators.string(value)
-    elif isinstance(value, dict) and 'pattern_options' in value:
-        value = Pattern(**value)
-    elif isinstance(value, str):
-        value = validators.string(value)
+        else:
+            value = validators.string(value)
     else:
         raise errors.HighchartsValueError(f'Unable to resolve value to a string, '
                                           f'Gradient, or Pattern. Value received '
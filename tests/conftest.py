@@ -57,6 +57,34 @@ def pytest_addoption(parser):
                      action = 'store',
                      default = os.getenv('ENABLE_PANDAS', 'true'),
                      help=('pandas: set to "false" to disable tests of pandas-related'))
+    parser.addoption('--runslow',
+                     action = 'store_true',
+                     default = False,
+                     help = ('runslow: run tests marked as slow, which are skipped by '
+                             'default'))
+
+
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line(
+        'markers',
+        'slow: marks a test as slow - skipped unless --runslow is supplied'
+    )
+    config.addinivalue_line(
+        'markers',
+        'pandas: marks a test as requiring pandas - deselect with -m "not pandas"'
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow unless ``--runslow`` was supplied."""
+    if config.getoption('--runslow'):
+        return
+
+    skip_slow = pytest.mark.skip(reason = 'needs --runslow option to run')
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
 
 
 def pytest_runtest_makereport(item, call):
@@ -771,11 +771,28 @@ def append_plot_options_type(cls, as_str):
     return as_str
 
 
+_input_file_contents = {}
+
+
+def read_input_file(input_file):
+    """Return the text of ``input_file``, caching it so repeated
+    parametrizations over the same file (e.g. ``as_file`` ``True``/``False``)
+    only hit the disk once per session."""
+    try:
+        return _input_file_contents[input_file]
+    except KeyError:
+        with open(input_file, 'r') as file_:
+            as_str = file_.read()
+
+        _input_file_contents[input_file] = as_str
+
+        return as_str
+
+
 def Class_from_js_literal(cls, input_files, filename, as_file, error):
     input_file = check_input_file(input_files, filename)
 
-    with open(input_file, 'r') as file_:
-        as_str = file_.read()
+    as_str = read_input_file(input_file)
 
     if as_file:
         input_string = input_file
@@ -826,11 +843,8 @@ def Class_from_js_literal_with_expected(cls,
     input_file = check_input_file(input_files, filename)
     expected_file = check_input_file(input_files, expected_filename)
 
-    with open(input_file, 'r') as file_:
-        as_str = file_.read()
-
-    with open(expected_file, 'r') as file_:
-        expected_as_str = file_.read()
+    as_str = read_input_file(input_file)
+    expected_as_str = read_input_file(expected_file)
 
     if as_file:
         input_string = input_file
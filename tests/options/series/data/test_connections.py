@@ -429,6 +429,14 @@ def test_ConnectionData_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls2, input_files, filename, as_file, error)
 
 
+def test_ConnectionData_get_required_modules():
+    # Regression test: attributes stored in __slots__ must remain visible to
+    # module discovery.
+    instance = cls2(drag_drop = {'draggableX': True})
+    result = instance.get_required_modules()
+    assert 'modules/draggable-points' in result
+
+
 ## NEXT CLASS
 
 STANDARD_PARAMS_3 = [
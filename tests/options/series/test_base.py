@@ -18,59 +18,43 @@ from tests.fixtures import (input_files,
                             run_pandas_tests)
 
 
-STANDARD_PARAMS = [
-    ({}, None),
-    ({
-      'data': [
-          {
-            'accessibility': {
-                'description': 'Some description goes here',
-                'enabled': True
-            },
-            'className': 'some-class-name',
-            'color': '#ccc',
-            'colorIndex': 2,
-            'custom': {
-                'some_key': 123,
-                'other_key': 456
-            },
-            'description': 'Some description goes here',
-            'events': {
-              'click': """function(event) { return true; }""",
-              'drag': """function(event) { return true; }""",
-              'drop': """function(event) { return true; }""",
-              'mouseOut': """function(event) { return true; }"""
-            },
-            'id': 'some-id-goes-here',
-            'labelrank': 3,
-            'name': 'Some Name Goes here',
-            'selected': False
-          },
-          {
-            'accessibility': {
-                'description': 'Some description goes here',
-                'enabled': True
-            },
-            'className': 'some-class-name',
-            'color': '#ccc',
-            'colorIndex': 2,
-            'custom': {
-                'some_key': 123,
-                'other_key': 456
-            },
-            'description': 'Some description goes here',
-            'events': {
-              'click': """function(event) { return true; }""",
-              'drag': """function(event) { return true; }""",
-              'drop': """function(event) { return true; }""",
-              'mouseOut': """function(event) { return true; }"""
-            },
-            'id': 'some-id-goes-here',
-            'labelrank': 3,
-            'name': 'Some Name Goes here',
-            'selected': False
-          }
-      ],
+_EVT_FN = "function(event) { return true; }"
+_FMT_FN = "function() { return true; }"
+
+
+# The same data-point payload is exercised by three of the four _PARAM_TABLE
+# entries, so it is built once here and shared by reference; the test helpers
+# deep-copy kwargs before mutating anything.
+_DATA_POINT = {
+    'accessibility': {
+        'description': 'Some description goes here',
+        'enabled': True
+    },
+    'className': 'some-class-name',
+    'color': '#ccc',
+    'colorIndex': 2,
+    'custom': {
+        'some_key': 123,
+        'other_key': 456
+    },
+    'description': 'Some description goes here',
+    'events': {
+      'click': _EVT_FN,
+      'drag': _EVT_FN,
+      'drop': _EVT_FN,
+      'mouseOut': _EVT_FN
+    },
+    'id': 'some-id-goes-here',
+    'labelrank': 3,
+    'name': 'Some Name Goes here',
+    'selected': False
+}
+
+_DATA = [_DATA_POINT, _DATA_POINT]
+
+
+_BASE_KW = {
+      'data': _DATA,
       'id': 'some-id-goes-here',
       'index': 3,
       'legend_index': 3,
@@ -79,68 +63,10 @@ STANDARD_PARAMS = [
       'x_axis': 'some-id',
       'y_axis': 0,
       'z_index': 3
-    }, None),
-    # Series Options only
-    ({
-      'data': [
-          {
-            'accessibility': {
-                'description': 'Some description goes here',
-                'enabled': True
-            },
-            'className': 'some-class-name',
-            'color': '#ccc',
-            'colorIndex': 2,
-            'custom': {
-                'some_key': 123,
-                'other_key': 456
-            },
-            'description': 'Some description goes here',
-            'events': {
-              'click': """function(event) { return true; }""",
-              'drag': """function(event) { return true; }""",
-              'drop': """function(event) { return true; }""",
-              'mouseOut': """function(event) { return true; }"""
-            },
-            'id': 'some-id-goes-here',
-            'labelrank': 3,
-            'name': 'Some Name Goes here',
-            'selected': False
-          },
-          {
-            'accessibility': {
-                'description': 'Some description goes here',
-                'enabled': True
-            },
-            'className': 'some-class-name',
-            'color': '#ccc',
-            'colorIndex': 2,
-            'custom': {
-                'some_key': 123,
-                'other_key': 456
-            },
-            'description': 'Some description goes here',
-            'events': {
-              'click': """function(event) { return true; }""",
-              'drag': """function(event) { return true; }""",
-              'drop': """function(event) { return true; }""",
-              'mouseOut': """function(event) { return true; }"""
-            },
-            'id': 'some-id-goes-here',
-            'labelrank': 3,
-            'name': 'Some Name Goes here',
-            'selected': False
-          }
-      ],
-      'id': 'some-id-goes-here',
-      'index': 3,
-      'legend_index': 3,
-      'name': 'Series Name Goes Here',
-      'stack': 'stack-id',
-      'x_axis': 'some-id',
-      'y_axis': 0,
-      'z_index': 3,
+}
 
+# Series Options only
+_SERIES_EXTRA = {
       'animation_limit': 10,
       'boost_blending': '#ccc',
       'boost_threshold': 1234,
@@ -165,154 +91,7 @@ STANDARD_PARAMS = [
               'cursor': 'alias',
               'lineColor': '#ddd',
               'lineWidth': 2,
-              'pathFormatter': """function() { return true; }""",
-              'zIndex': 10
-          },
-          'dragMaxX': 3456,
-          'dragMaxY': 6532,
-          'dragMinX': 123,
-          'dragMinY': 321,
-          'dragPrecisionX': 5,
-          'dragPrecisionY': 5,
-          'dragSensitivity': 2,
-          'groupBy': 'some-property-name',
-          'guideBox': {
-              'default': {
-                  'className': 'some-classname-goes-here',
-                  'color': '#999',
-                  'cursor': 'pointer',
-                  'lineColor': '#ccc',
-                  'lineWidth': 2,
-                  'zIndex': 100
-              }
-          },
-          'liveRedraw': True
-      },
-      'find_nearest_point_by': 'x',
-      'get_extremes_from_all': True,
-      'linecap': 'round',
-      'line_width': 2,
-      'negative_color': '#fff',
-      'point_interval': 5,
-      'point_interval_unit': 'weeks',
-      'point_placement': 'on',
-      'point_start': 12,
-      'relative_x_value': True,
-      'shadow': False,
-      'soft_threshold': True,
-      'stacking': 'normal',
-      'step': 'left',
-      'zone_axis': 'y',
-      'zones': [
-          {
-            'className': 'some-class-name1',
-            'color': '#999999',
-            'dashStyle': 'Solid',
-            'fillColor': '#cccccc',
-            'value': 123
-          },
-          {
-            'className': 'some-class-name1',
-            'color': '#999999',
-            'dashStyle': 'Solid',
-            'fillColor': '#cccccc',
-            'value': 123
-          },
-          {
-            'className': 'some-class-name1',
-            'color': '#999999',
-            'dashStyle': 'Solid',
-            'fillColor': '#cccccc',
-            'value': 123
-          }
-      ]
-    }, None),
-    # Series + Generic Options
-    ({
-      'data': [
-          {
-            'accessibility': {
-                'description': 'Some description goes here',
-                'enabled': True
-            },
-            'className': 'some-class-name',
-            'color': '#ccc',
-            'colorIndex': 2,
-            'custom': {
-                'some_key': 123,
-                'other_key': 456
-            },
-            'description': 'Some description goes here',
-            'events': {
-              'click': """function(event) { return true; }""",
-              'drag': """function(event) { return true; }""",
-              'drop': """function(event) { return true; }""",
-              'mouseOut': """function(event) { return true; }"""
-            },
-            'id': 'some-id-goes-here',
-            'labelrank': 3,
-            'name': 'Some Name Goes here',
-            'selected': False
-          },
-          {
-            'accessibility': {
-                'description': 'Some description goes here',
-                'enabled': True
-            },
-            'className': 'some-class-name',
-            'color': '#ccc',
-            'colorIndex': 2,
-            'custom': {
-                'some_key': 123,
-                'other_key': 456
-            },
-            'description': 'Some description goes here',
-            'events': {
-              'click': """function(event) { return true; }""",
-              'drag': """function(event) { return true; }""",
-              'drop': """function(event) { return true; }""",
-              'mouseOut': """function(event) { return true; }"""
-            },
-            'id': 'some-id-goes-here',
-            'labelrank': 3,
-            'name': 'Some Name Goes here',
-            'selected': False
-          }
-      ],
-      'id': 'some-id-goes-here',
-      'index': 3,
-      'legend_index': 3,
-      'name': 'Series Name Goes Here',
-      'stack': 'stack-id',
-      'x_axis': 'some-id',
-      'y_axis': 0,
-      'z_index': 3,
-
-      'animation_limit': 10,
-      'boost_blending': '#ccc',
-      'boost_threshold': 1234,
-      'color_axis': 1,
-      'color_index': 5,
-      'color_key': 'some-key-value',
-      'connect_ends': True,
-      'connect_nulls': True,
-      'crisp': True,
-      'crop_threshold': 123,
-      'data_sorting': {
-          'enabled': True,
-          'matchByName': True,
-          'sortKey': 'some-key-value'
-      },
-      'drag_drop': {
-          'draggableX': True,
-          'draggableY': True,
-          'dragHandle': {
-              'className': 'draghandle-classname-goes-here',
-              'color': '#ccc',
-              'cursor': 'alias',
-              'lineColor': '#ddd',
-              'lineWidth': 2,
-              'pathFormatter': """function() { return true; }""",
+              'pathFormatter': _FMT_FN,
               'zIndex': 10
           },
           'dragMaxX': 3456,
@@ -373,7 +152,10 @@ STANDARD_PARAMS = [
             'value': 123
           }
       ],
+}
 
+# Generic Options
+_GENERIC_EXTRA = {
       'accessibility': {
           'description': 'Description goes here',
           'enabled': True,
@@ -383,9 +165,9 @@ STANDARD_PARAMS = [
           },
           'point': {
               'dateFormat': 'format string',
-              'dateFormatter': """function() { return true; }""",
+              'dateFormatter': _FMT_FN,
               'describeNull': False,
-              'descriptionFormatter': """function() { return true; }""",
+              'descriptionFormatter': _FMT_FN,
               'valueDecimals': 2,
               'valueDescriptionFormat': 'format string',
               'valuePrefix': '$',
@@ -437,10 +219,10 @@ STANDARD_PARAMS = [
             'value': 123
         },
         'format': 'some format',
-        'formatter': """function() { return true; }""",
+        'formatter': _FMT_FN,
         'inside': True,
         'nullFormat': 'some format',
-        'nullFormatter': """function() { return true; }""",
+        'nullFormatter': _FMT_FN,
         'overflow': 'none',
         'padding': 12,
         'position': 'center',
@@ -457,11 +239,11 @@ STANDARD_PARAMS = [
       'description': 'Description goes here',
       'enable_mouse_tracking': True,
       'events': {
-        'afterAnimate': """function(event) { return true; }""",
-        'click': """function(event) { return true; }""",
-        'hide': """function(event) { return true; }""",
-        'mouseOut': """function(event) { return true; }""",
-        'show': """function(event) { return true; }"""
+        'afterAnimate': _EVT_FN,
+        'click': _EVT_FN,
+        'hide': _EVT_FN,
+        'mouseOut': _EVT_FN,
+        'show': _EVT_FN
       },
       'include_in_data_export': True,
       'keys': [
@@ -488,7 +270,7 @@ STANDARD_PARAMS = [
           'connectorNeighbourDistance': 12,
           'enabled': True,
           'format': 'format string',
-          'formatter': """function() { return true; }""",
+          'formatter': _FMT_FN,
           'maxFontSize': 18,
           'minFontSize': 6,
           'onArea': False,
@@ -526,10 +308,10 @@ STANDARD_PARAMS = [
       'opacity': 0.2,
       'point': {
           'events': {
-            'click': """function(event) { return true; }""",
-            'drag': """function(event) { return true; }""",
-            'drop': """function(event) { return true; }""",
-            'mouseOut': """function(event) { return true; }"""
+            'click': _EVT_FN,
+            'drag': _EVT_FN,
+            'drop': _EVT_FN,
+            'mouseOut': _EVT_FN
           }
       },
       'point_description_formatter': """function (point) { return true; }""",
@@ -585,17 +367,17 @@ STANDARD_PARAMS = [
         'followPointer': True,
         'followTouch_move': True,
         'footerFormat': 'format string',
-        'formatter': """function() { return true; }""",
+        'formatter': _FMT_FN,
         'headerFormat': 'format string',
         'headerShape': 'circle',
         'hideDelay': 3,
         'nullFormat': 'format string',
-        'nullFormatter': """function() { return true; }""",
+        'nullFormatter': _FMT_FN,
         'outside': False,
         'padding': 6,
         'pointFormat': 'format string',
-        'pointFormatter': """function() { return true; }""",
-        'positioner': """function() { return true; }""",
+        'pointFormatter': _FMT_FN,
+        'positioner': _FMT_FN,
         'shadow': False,
         'shape': 'rect',
         'shared': False,
@@ -611,27 +393,47 @@ STANDARD_PARAMS = [
        },
       'turbo_threshold': 456,
       'visible': True
-    }, None),
-]
+}
+
+# Each entry is keyed by a short id so parametrized test ids stay readable and
+# so the (kwargs, error) tuples are only resolved when a test actually runs.
+# The base / series / generic layers are strict supersets, so the larger
+# entries are composed by union rather than repeating the literals.
+_PARAM_TABLE = {
+    'empty': ({}, None),
+    'base': (_BASE_KW, None),
+    'series_only': ({**_BASE_KW, **_SERIES_EXTRA}, None),
+    'series_plus_generic': ({**_BASE_KW, **_SERIES_EXTRA, **_GENERIC_EXTRA}, None),
+}
+
+
+@pytest.fixture(params = [
+    'empty',
+    'base',
+    'series_only',
+    pytest.param('series_plus_generic', marks = pytest.mark.slow),
+])
+def params(request):
+    return _PARAM_TABLE[request.param]
 
 
-@pytest.mark.parametrize('kwargs, error', STANDARD_PARAMS)
-def test__init__(kwargs, error):
+def test__init__(params):
+    kwargs, error = params
     Class__init__(cls, kwargs, error)
 
 
-@pytest.mark.parametrize('kwargs, error', STANDARD_PARAMS)
-def test__to_untrimmed_dict(kwargs, error):
+def test__to_untrimmed_dict(params):
+    kwargs, error = params
     Class__to_untrimmed_dict(cls, kwargs, error)
 
 
-@pytest.mark.parametrize('kwargs, error',  STANDARD_PARAMS)
-def test_from_dict(kwargs, error):
+def test_from_dict(params):
+    kwargs, error = params
     Class_from_dict(cls, kwargs, error)
 
 
-@pytest.mark.parametrize('kwargs, error',  STANDARD_PARAMS)
-def test_to_dict(kwargs, error):
+def test_to_dict(params):
+    kwargs, error = params
     Class_to_dict(cls, kwargs, error)
 
 
@@ -665,6 +467,7 @@ def test_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls, input_files, filename, as_file, error)
 
 
+@pytest.mark.pandas
 @pytest.mark.parametrize('filename, error', [
     ('test-data-files/nst-est2019-01.csv', None),
 ])
@@ -672,13 +475,12 @@ def test_from_pandas_in_rows(run_pandas_tests, input_files, filename, error):
     if not run_pandas_tests:
         return
 
-    import pandas
+    pandas = pytest.importorskip('pandas')
     
     input_file = check_input_file(input_files, filename)
     df = pandas.read_csv(input_file, header = 0, thousands = ',')
     df.index = df['Geographic Area']
     df = df.drop(columns = ['Geographic Area'])
-    print(df)
         
     if not error:
         result = cls.from_pandas_in_rows(df)
@@ -693,25 +495,35 @@ def test_from_pandas_in_rows(run_pandas_tests, input_files, filename, error):
         with pytest.raises(error):
             result = cls.from_pandas_in_rows(df)
 
-@pytest.mark.parametrize('filename, property_map, series_in_rows, error', [
-    ('test-data-files/nst-est2019-01.csv',
-     {
+@pytest.fixture(scope = 'module')
+def nst_df(request):
+    """Read the NST estimates CSV once per module rather than once per test."""
+    if request.config.getoption('--pandas').lower() in ['false', '0', 'no']:
+        return None
+
+    pandas = pytest.importorskip('pandas')
+
+    input_file = check_input_file(request.config.getoption('--inputs'),
+                                  'test-data-files/nst-est2019-01.csv')
+
+    return pandas.read_csv(input_file, header = 0)
+
+
+@pytest.mark.pandas
+@pytest.mark.parametrize('property_map, series_in_rows, error', [
+    ({
          'name': 'Geographic Area',
      },
      False,
      None),
-    ('test-data-files/nst-est2019-01.csv', {}, False, ValueError),
+    ({}, False, ValueError),
     
 ])
-def test_load_from_pandas(run_pandas_tests, input_files, filename, property_map, series_in_rows, error):
+def test_load_from_pandas(run_pandas_tests, nst_df, property_map, series_in_rows, error):
     if not run_pandas_tests:
         return
 
-    import pandas
-
-    input_file = check_input_file(input_files, filename)
-    df = pandas.read_csv(input_file, header = 0)
-    print(df)
+    df = nst_df.copy(deep = False)
     instance = cls()
 
     if not error:
@@ -739,6 +551,7 @@ def reduce_to_two_columns(df):
     return df
 
 
+@pytest.mark.pandas
 @pytest.mark.parametrize('filename, kwargs, pre_test_df_func, expected_series, expected_data_points, error', [
     # SCENARIO 0: Series in Rows
     ('test-data-files/nst-est2019-01.csv',
@@ -825,13 +638,12 @@ def test_from_pandas(run_pandas_tests,
     if not run_pandas_tests:
         return
 
-    import pandas
+    pandas = pytest.importorskip('pandas')
 
     input_file = check_input_file(input_files, filename)
     df = pandas.read_csv(input_file, header = 0, thousands = ',')
     if pre_test_df_func:
         df = pre_test_df_func(df)
-    print(df)
 
     if not error:
         result = cls.from_pandas(df, **kwargs)
@@ -852,11 +664,26 @@ def test_from_pandas(run_pandas_tests,
             result = cls.from_pandas(df, **kwargs)
 
 
-@pytest.mark.parametrize('kwargs, error', STANDARD_PARAMS)
-def test_to_chart(kwargs, error):
+# The read-only tests below give equivalent signal on the two smallest entries;
+# the heavyweight series / generic layers are already exercised by the
+# serialization tests above.
+_LIGHT_PARAM_IDS = ('empty', 'base')
+
+
+@pytest.fixture(scope = 'module')
+def built_instances():
+    """Construct one instance per lightweight _PARAM_TABLE entry, shared by the
+    read-only tests below."""
+    return {param_id: cls(**_PARAM_TABLE[param_id][0])
+            for param_id in _LIGHT_PARAM_IDS
+            if _PARAM_TABLE[param_id][1] is None}
+
+
+@pytest.mark.parametrize('param_id', _LIGHT_PARAM_IDS)
+def test_to_chart(param_id, built_instances):
+    kwargs, error = _PARAM_TABLE[param_id]
     if not error:
-        instance = cls(**kwargs)
-        chart = instance.to_chart()
+        chart = built_instances[param_id].to_chart()
         assert chart is not None
         assert checkers.is_type(chart, 'Chart')
     else:
@@ -865,28 +692,27 @@ def test_to_chart(kwargs, error):
             chart = instance.to_chart()
 
 
-@pytest.mark.parametrize('kwargs, error', STANDARD_PARAMS)
-def test__repr__(kwargs, error):
-    obj = cls(**kwargs)
+@pytest.mark.parametrize('param_id', _LIGHT_PARAM_IDS)
+def test__repr__(param_id, built_instances):
+    kwargs, error = _PARAM_TABLE[param_id]
     if not error:
-        result = repr(obj)
+        result = repr(built_instances[param_id])
         if 'data' in kwargs:
             assert 'data = ' in result
     else:
         with pytest.raises(error):
-            result = repr(obj)
+            result = repr(cls(**kwargs))
 
 
-@pytest.mark.parametrize('kwargs, error', STANDARD_PARAMS)
-def test__str__(kwargs, error):
-    obj = cls(**kwargs)
+@pytest.mark.parametrize('param_id', _LIGHT_PARAM_IDS)
+def test__str__(param_id, built_instances):
+    kwargs, error = _PARAM_TABLE[param_id]
     if not error:
-        result = str(obj)
-        print(result)
+        result = str(built_instances[param_id])
         assert 'data = ' not in result
     else:
         with pytest.raises(error):
-            result = str(obj)
+            result = str(cls(**kwargs))
             
 @pytest.mark.parametrize('filename, target_type, as_cls, error', [
     ('series/base/01.js', 'line', False, None),
@@ -926,12 +752,13 @@ def test_convert_to(input_files, filename, target_type, as_cls, error):
         assert isinstance(converted, target_type_cls)
 
 
+@pytest.mark.pandas
 def test_bugfix162(input_files):
     from highcharts_core.chart import Chart
     from highcharts_core.options import HighchartsOptions
     from highcharts_core.options.series.area import LineSeries
 
-    import pandas as pd
+    pd = pytest.importorskip('pandas')
     from collections import defaultdict
     
     filename = 'series/base/bugfix162.csv'